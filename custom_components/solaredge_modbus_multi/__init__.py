@@ -4,7 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
+from dataclasses import dataclass
 from datetime import timedelta
+from itertools import chain
+from typing import Final
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
@@ -17,16 +21,16 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, Upda
 from .const import DOMAIN, ConfDefaultInt, ConfName, RetrySettings
 from .hub import DataUpdateFailed, HubInitFailed, SolarEdgeModbusMultiHub
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER: Final = logging.getLogger(__name__)
 
-PLATFORMS: list[str] = [
+PLATFORMS: Final[tuple[Platform, ...]] = (
     Platform.BINARY_SENSOR,
     Platform.BUTTON,
     Platform.NUMBER,
     Platform.SELECT,
     Platform.SENSOR,
     Platform.SWITCH,
-]
+)
 
 # This is probably not allowed per ADR-0010, but I need a way to
 # set advanced config that shouldn't appear in any UI dialogs.
@@ -76,10 +80,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.options.get(CONF_SCAN_INTERVAL, ConfDefaultInt.SCAN_INTERVAL),
     )
 
-    hass.data[DOMAIN][entry.entry_id] = {
-        "hub": solaredge_hub,
-        "coordinator": coordinator,
-    }
+    hass.data[DOMAIN][entry.entry_id] = SolarEdgeRuntimeData(
+        hub=solaredge_hub, coordinator=coordinator
+    )
 
     await coordinator.async_config_entry_first_refresh()
 
@@ -92,7 +95,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    solaredge_hub = hass.data[DOMAIN][entry.entry_id]["hub"]
+    solaredge_hub = hass.data[DOMAIN][entry.entry_id].hub
     await solaredge_hub.shutdown()
 
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -111,45 +114,26 @@ async def async_remove_config_entry_device(
     hass: HomeAssistant, config_entry: ConfigEntry, device_entry: DeviceEntry
 ) -> bool:
     """Remove a config entry from a device."""
-    solaredge_hub = hass.data[DOMAIN][config_entry.entry_id]["hub"]
+    solaredge_hub = hass.data[DOMAIN][config_entry.entry_id].hub
 
-    known_devices = []
-
-    for inverter in solaredge_hub.inverters:
-        inverter_device_ids = {
-            dev_id[1]
-            for dev_id in inverter.device_info["identifiers"]
-            if dev_id[0] == DOMAIN
-        }
-        for dev_id in inverter_device_ids:
-            known_devices.append(dev_id)
-
-    for meter in solaredge_hub.meters:
-        meter_device_ids = {
-            dev_id[1]
-            for dev_id in meter.device_info["identifiers"]
-            if dev_id[0] == DOMAIN
-        }
-        for dev_id in meter_device_ids:
-            known_devices.append(dev_id)
-
-    for battery in solaredge_hub.batteries:
-        battery_device_ids = {
-            dev_id[1]
-            for dev_id in battery.device_info["identifiers"]
-            if dev_id[0] == DOMAIN
-        }
-        for dev_id in battery_device_ids:
-            known_devices.append(dev_id)
+    known_devices = {
+        dev_id[1]
+        for device in chain(
+            solaredge_hub.inverters, solaredge_hub.meters, solaredge_hub.batteries
+        )
+        for dev_id in device.device_info["identifiers"]
+        if dev_id[0] == DOMAIN
+    }
 
     this_device_ids = {
         dev_id[1] for dev_id in device_entry.identifiers if dev_id[0] == DOMAIN
     }
 
-    for device_id in this_device_ids:
-        if device_id in known_devices:
-            _LOGGER.error(f"Unable to remove entry: device {device_id} is in use")
-            return False
+    if in_use := this_device_ids & known_devices:
+        _LOGGER.error(
+            "Unable to remove entry: device %s is in use", ", ".join(sorted(in_use))
+        )
+        return False
 
     return True
 
@@ -157,50 +141,38 @@ async def async_remove_config_entry_device(
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Migrate old entry."""
     _LOGGER.debug(
-        "Migrating from config version "
-        f"{config_entry.version}.{config_entry.minor_version}"
+        "Migrating from config version %s.%s",
+        config_entry.version,
+        config_entry.minor_version,
     )
 
     if config_entry.version > 2:
         return False
 
-    if config_entry.version == 1:
-        _LOGGER.debug("Migrating from version 1")
+    # apply every step to local copies, then save the entry once
+    version = config_entry.version
+    minor_version = config_entry.minor_version
+    update_data = dict(config_entry.data)
+    update_options = dict(config_entry.options)
+    unique_id = config_entry.unique_id
 
-        update_data = {**config_entry.data}
-        update_options = {**config_entry.options}
+    if version == 1:
+        _LOGGER.debug("Migrating from version 1")
 
         if CONF_SCAN_INTERVAL in update_data:
-            update_options = {
-                **update_options,
-                CONF_SCAN_INTERVAL: update_data.pop(CONF_SCAN_INTERVAL),
-            }
+            update_options[CONF_SCAN_INTERVAL] = update_data.pop(CONF_SCAN_INTERVAL)
 
         start_device_id = update_data.pop(ConfName.DEVICE_ID)
         number_of_inverters = update_data.pop(ConfName.NUMBER_INVERTERS)
 
-        inverter_list = []
-        for inverter_index in range(number_of_inverters):
-            inverter_unit_id = inverter_index + start_device_id
-            inverter_list.append(inverter_unit_id)
-
-        update_data = {
-            **update_data,
-            ConfName.DEVICE_LIST: inverter_list,
-        }
-
-        hass.config_entries.async_update_entry(
-            config_entry,
-            data=update_data,
-            options=update_options,
-            version=2,
-            minor_version=0,
+        update_data[ConfName.DEVICE_LIST] = list(
+            range(start_device_id, start_device_id + number_of_inverters)
         )
 
-    if config_entry.version == 2 and config_entry.minor_version < 1:
-        _LOGGER.debug("Migrating from version 2.0")
+        version, minor_version = 2, 0
 
-        config_entry_data = {**config_entry.data}
+    if version == 2 and minor_version < 1:
+        _LOGGER.debug("Migrating from version 2.0")
 
         # Use host:port address string as the config entry unique ID.
         # This is technically not a valid HA unique ID, but with modbus
@@ -208,22 +180,30 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         # single SE modbus IP could have up to 32 different serial numbers
         # and the "leader" modbus unit id can't be known programmatically.
 
-        old_unique_id = config_entry.unique_id
-        new_unique_id = f"{config_entry_data[CONF_HOST]}:{config_entry_data[CONF_PORT]}"
+        old_unique_id = unique_id
+        unique_id = f"{update_data[CONF_HOST]}:{update_data[CONF_PORT]}"
 
         _LOGGER.warning(
             "Migrating config entry unique ID from %s to %s",
             old_unique_id,
-            new_unique_id,
+            unique_id,
         )
 
-        hass.config_entries.async_update_entry(
-            config_entry, unique_id=new_unique_id, version=2, minor_version=1
-        )
+        minor_version = 1
+
+    hass.config_entries.async_update_entry(
+        config_entry,
+        data=update_data,
+        options=update_options,
+        unique_id=unique_id,
+        version=version,
+        minor_version=minor_version,
+    )
 
     _LOGGER.warning(
-        "Migrated to config version "
-        f"{config_entry.version}.{config_entry.minor_version}"
+        "Migrated to config version %s.%s",
+        config_entry.version,
+        config_entry.minor_version,
     )
 
     return True
@@ -242,30 +222,34 @@ class SolarEdgeCoordinator(DataUpdateCoordinator):
         self._hub = hub
         self._yaml_config = hass.data[DOMAIN]["yaml"]
 
+        retry_config = self._yaml_config.get("retry", {})
+        self._retry_settings = {
+            "limit": retry_config.get("limit", RetrySettings.Limit),
+            "wait_ms": retry_config.get("time", RetrySettings.Time),
+            "wait_ratio": retry_config.get("ratio", RetrySettings.Ratio),
+        }
+
+        self._refresh_lock = asyncio.Lock()
+
     async def _async_update_data(self) -> bool:
-        try:
-            while self._hub.has_write:
-                _LOGGER.debug(f"Waiting for write {self._hub.has_write}")
-                await asyncio.sleep(1)
-
-            return await self._refresh_modbus_data_with_retry(
-                ex_type=DataUpdateFailed,
-                limit=self._yaml_config.get("retry", {}).get(
-                    "limit", RetrySettings.Limit
-                ),
-                wait_ms=self._yaml_config.get("retry", {}).get(
-                    "time", RetrySettings.Time
-                ),
-                wait_ratio=self._yaml_config.get("retry", {}).get(
-                    "ratio", RetrySettings.Ratio
-                ),
-            )
+        # a slow poll can outlast the scan interval; let the next one
+        # reuse the last result instead of queueing behind it
+        if self._refresh_lock.locked():
+            _LOGGER.debug("Previous refresh still in progress, skipping")
+            return self.data
+
+        async with self._refresh_lock:
+            try:
+                if self._hub.has_write:
+                    _LOGGER.debug("Waiting for write %s", self._hub.has_write)
+                    await self._hub.wait_for_write()
 
-        except HubInitFailed as e:
-            raise UpdateFailed(f"{e}")
+                return await self._refresh_modbus_data_with_retry(
+                    ex_type=DataUpdateFailed, **self._retry_settings
+                )
 
-        except DataUpdateFailed as e:
-            raise UpdateFailed(f"{e}")
+            except (HubInitFailed, DataUpdateFailed) as e:
+                raise UpdateFailed(f"{e}") from e
 
     async def _refresh_modbus_data_with_retry(
         self,
@@ -281,27 +265,36 @@ class SolarEdgeCoordinator(DataUpdateCoordinator):
         :param wait_ms: initial wait time after each attempt in milliseconds.
         :param wait_ratio: increase wait by multiplying by this after each try.
         :return: result of first successful invocation
-        :raises: last invocation exception if attempts exhausted
-                 or exception is not an instance of ex_type
+        :raises: last invocation exception if attempts exhausted;
+                 exceptions not of ex_type propagate immediately
         Credit: https://gist.github.com/davidohana/c0518ff6a6b95139e905c8a8caef9995
         """
-        _LOGGER.debug(f"Retry limit={limit} time={wait_ms} ratio={wait_ratio}")
+        _LOGGER.debug("Retry limit=%s time=%s ratio=%s", limit, wait_ms, wait_ratio)
         attempt = 1
         while True:
             try:
                 return await self._hub.async_refresh_modbus_data()
-            except Exception as ex:
-                if not isinstance(ex, ex_type):
-                    raise ex
+            except ex_type:
                 if 0 < limit <= attempt:
-                    _LOGGER.debug(f"No more data refresh attempts (maximum {limit})")
-                    raise ex
+                    _LOGGER.debug("No more data refresh attempts (maximum %s)", limit)
+                    raise
 
-                _LOGGER.debug(f"Failed data refresh attempt {attempt}")
+                _LOGGER.debug("Failed data refresh attempt %s", attempt)
+
+                # jitter keeps entries sharing a gateway from retrying in step
+                delay_ms = wait_ms + random.randint(0, wait_ms // 4)
 
                 attempt += 1
                 _LOGGER.debug(
-                    f"Waiting {wait_ms} ms before data refresh attempt {attempt}"
+                    "Waiting %s ms before data refresh attempt %s", delay_ms, attempt
                 )
-                await asyncio.sleep(wait_ms / 1000)
+                await asyncio.sleep(delay_ms / 1000)
                 wait_ms *= wait_ratio
+
+
+@dataclass(slots=True)
+class SolarEdgeRuntimeData:
+    """Hub and coordinator shared by the platforms of a config entry."""
+
+    hub: SolarEdgeModbusMultiHub
+    coordinator: SolarEdgeCoordinator
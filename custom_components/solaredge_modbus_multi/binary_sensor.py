@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Final
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -16,7 +17,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER: Final = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
@@ -24,8 +25,9 @@ async def async_setup_entry(
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    hub = hass.data[DOMAIN][config_entry.entry_id]["hub"]
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    runtime_data = hass.data[DOMAIN][config_entry.entry_id]
+    hub = runtime_data.hub
+    coordinator = runtime_data.coordinator
 
     entities = []
 
@@ -51,10 +53,8 @@ class SolarEdgeBinarySensorBase(CoordinatorEntity, BinarySensorEntity):
         """Initialize the sensor."""
         self._platform = platform
         self._config_entry = config_entry
-
-    @property
-    def device_info(self):
-        return self._platform.device_info
+        self._attr_device_info = platform.device_info
+        self._update_attrs()
 
     @property
     def config_entry_id(self):
@@ -66,10 +66,16 @@ class SolarEdgeBinarySensorBase(CoordinatorEntity, BinarySensorEntity):
 
     @property
     def available(self) -> bool:
-        return super().available and self._platform.online
+        # CoordinatorEntity.available only reports the coordinator state
+        return super().available and self._attr_available
+
+    def _update_attrs(self) -> None:
+        """Update entity attributes from the latest device data."""
+        self._attr_available = self._platform.online
 
     @callback
     def _handle_coordinator_update(self) -> None:
+        self._update_attrs()
         self.async_write_ha_state()
 
 
@@ -77,26 +83,23 @@ class AdvPowerControlEnabled(SolarEdgeBinarySensorBase):
     """Grid Control boolean status. This is "AdvancedPwrControlEn" in specs."""
 
     entity_category = EntityCategory.DIAGNOSTIC
+    _attr_name = "Advanced Power Control"
 
-    @property
-    def available(self) -> bool:
-        return (
-            super().available
+    def __init__(self, platform, config_entry, coordinator):
+        super().__init__(platform, config_entry, coordinator)
+        self._attr_unique_id = f"{platform.uid_base}_adv_pwr_ctrl_en"
+
+    def _update_attrs(self) -> None:
+        super()._update_attrs()
+
+        self._attr_available = (
+            self._attr_available
             and self._platform.advanced_power_control is True
-            and "AdvPwrCtrlEn" in self._platform.decoded_model.keys()
+            and "AdvPwrCtrlEn" in self._platform.decoded_model
         )
 
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_adv_pwr_ctrl_en"
-
-    @property
-    def name(self) -> str:
-        return "Advanced Power Control"
-
-    @property
-    def is_on(self) -> bool:
-        return self._platform.decoded_model["AdvPwrCtrlEn"] == 0x1
+        if self._attr_available:
+            self._attr_is_on = self._platform.decoded_model["AdvPwrCtrlEn"] == 0x1
 
 
 class GridStatusOnOff(SolarEdgeBinarySensorBase):
@@ -104,25 +107,22 @@ class GridStatusOnOff(SolarEdgeBinarySensorBase):
 
     device_class = BinarySensorDeviceClass.POWER
     icon = "mdi:transmission-tower"
+    _attr_name = "Grid Status"
 
-    @property
-    def available(self) -> bool:
-        return (
-            super().available and "I_Grid_Status" in self._platform.decoded_model.keys()
-        )
+    def __init__(self, platform, config_entry, coordinator):
+        super().__init__(platform, config_entry, coordinator)
+        self._attr_unique_id = f"{platform.uid_base}_grid_status_on_off"
 
     @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_grid_status_on_off"
+    def entity_registry_enabled_default(self) -> bool:
+        return "I_Grid_Status" in self._platform.decoded_model
 
-    @property
-    def name(self) -> str:
-        return "Grid Status"
+    def _update_attrs(self) -> None:
+        super()._update_attrs()
 
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        return "I_Grid_Status" in self._platform.decoded_model.keys()
+        self._attr_available = (
+            self._attr_available and "I_Grid_Status" in self._platform.decoded_model
+        )
 
-    @property
-    def is_on(self) -> bool:
-        return not self._platform.decoded_model["I_Grid_Status"]
+        if self._attr_available:
+            self._attr_is_on = not self._platform.decoded_model["I_Grid_Status"]
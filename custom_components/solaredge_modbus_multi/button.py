@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Final
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
@@ -15,7 +16,20 @@ from pymodbus.payload import BinaryPayloadBuilder
 
 from .const import DOMAIN
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER: Final = logging.getLogger(__name__)
+
+# power control commit/default registers, written with a constant uint16 of 1
+_ADDR_COMMIT: Final = 61696
+_ADDR_DEFAULT: Final = 61697
+
+
+def _uint16_registers(value: int) -> tuple[int, ...]:
+    builder = BinaryPayloadBuilder(byteorder=Endian.BIG, wordorder=Endian.LITTLE)
+    builder.add_16bit_uint(value)
+    return tuple(builder.to_registers())
+
+
+_PAYLOAD_ENABLE: Final = _uint16_registers(1)
 
 
 async def async_setup_entry(
@@ -23,8 +37,9 @@ async def async_setup_entry(
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    hub = hass.data[DOMAIN][config_entry.entry_id]["hub"]
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    runtime_data = hass.data[DOMAIN][config_entry.entry_id]
+    hub = runtime_data.hub
+    coordinator = runtime_data.coordinator
 
     entities = []
 
@@ -55,10 +70,9 @@ class SolarEdgeButtonBase(CoordinatorEntity, ButtonEntity):
         """Initialize the sensor."""
         self._platform = platform
         self._config_entry = config_entry
-
-    @property
-    def device_info(self):
-        return self._platform.device_info
+        self._attr_device_info = platform.device_info
+        self._attr_unique_id = f"{platform.uid_base}{self._unique_id_suffix}"
+        self._last_available = None
 
     @property
     def config_entry_id(self):
@@ -74,51 +88,44 @@ class SolarEdgeButtonBase(CoordinatorEntity, ButtonEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self.async_write_ha_state()
+        # buttons have no state, only write when availability changes
+        if (available := self.available) != self._last_available:
+            self._last_available = available
+            self.async_write_ha_state()
 
 
 class SolarEdgeRefreshButton(SolarEdgeButtonBase):
     """Button to request an immediate device data update."""
 
-    entity_category = EntityCategory.CONFIG
-    icon = "mdi:refresh"
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_refresh"
-
-    @property
-    def name(self) -> str:
-        return "Refresh"
+    _attr_entity_category = EntityCategory.CONFIG
+    _attr_icon = "mdi:refresh"
+    _attr_name = "Refresh"
+    _unique_id_suffix = "_refresh"
 
     @property
     def available(self) -> bool:
         return True
 
     async def async_press(self) -> None:
-        await self.async_update()
+        # don't hold the service call open for a full modbus scan
+        self.hass.async_create_background_task(
+            self.coordinator.async_request_refresh(),
+            name=f"{self.unique_id} refresh",
+        )
 
 
 class SolarEdgeCommitControlSettings(SolarEdgeButtonBase):
     """Button to Commit Power Control Settings."""
 
-    entity_category = EntityCategory.CONFIG
-    icon = "mdi:content-save-cog-outline"
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}bt_commit_pwr_settings"
-
-    @property
-    def name(self) -> str:
-        return "Commit Power Settings"
+    _attr_entity_category = EntityCategory.CONFIG
+    _attr_icon = "mdi:content-save-cog-outline"
+    _attr_name = "Commit Power Settings"
+    _unique_id_suffix = "bt_commit_pwr_settings"
 
     async def async_press(self) -> None:
         _LOGGER.debug(f"set {self.unique_id} to 1")
-        builder = BinaryPayloadBuilder(byteorder=Endian.BIG, wordorder=Endian.LITTLE)
-        builder.add_16bit_uint(1)
         await self._platform.write_registers(
-            address=61696, payload=builder.to_registers()
+            address=_ADDR_COMMIT, payload=_PAYLOAD_ENABLE
         )
         await self.async_update()
 
@@ -126,16 +133,10 @@ class SolarEdgeCommitControlSettings(SolarEdgeButtonBase):
 class SolarEdgeDefaultControlSettings(SolarEdgeButtonBase):
     """Button to Restore Power Control Default Settings."""
 
-    entity_category = EntityCategory.CONFIG
-    icon = "mdi:restore-alert"
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}bt_default_pwr_settings"
-
-    @property
-    def name(self) -> str:
-        return "Default Power Settings"
+    _attr_entity_category = EntityCategory.CONFIG
+    _attr_icon = "mdi:restore-alert"
+    _attr_name = "Default Power Settings"
+    _unique_id_suffix = "bt_default_pwr_settings"
 
     @property
     def entity_registry_enabled_default(self) -> bool:
@@ -143,9 +144,7 @@ class SolarEdgeDefaultControlSettings(SolarEdgeButtonBase):
 
     async def async_press(self) -> None:
         _LOGGER.debug(f"set {self.unique_id} to 1")
-        builder = BinaryPayloadBuilder(byteorder=Endian.BIG, wordorder=Endian.LITTLE)
-        builder.add_16bit_uint(1)
         await self._platform.write_registers(
-            address=61697, payload=builder.to_registers()
+            address=_ADDR_DEFAULT, payload=_PAYLOAD_ENABLE
         )
         await self.async_update()
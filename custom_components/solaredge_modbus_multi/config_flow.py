@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import re
+from collections.abc import Callable
 from typing import Any
 
 import homeassistant.helpers.config_validation as cv
@@ -22,27 +22,149 @@ from .const import (
     ConfDefaultStr,
     ConfName,
 )
-from .helpers import device_list_from_string, host_valid
+from .helpers import address_in_hosts, device_list_from_string, host_valid
+
+
+def port_valid(port: Any) -> bool:
+    """Return True if cv.port accepts the port."""
+    try:
+        cv.port(port)
+    except vol.Invalid:
+        return False
+
+    return True
+
+
+# (field, predicate, error); every failing field is reported at once.
+CONFIG_VALIDATORS: tuple[tuple[str, Callable[[Any], bool], str], ...] = (
+    (CONF_HOST, host_valid, "invalid_host"),
+    (CONF_PORT, port_valid, "invalid_tcp_port"),
+)
+
+OPTIONS_VALIDATORS: tuple[tuple[str, Callable[[Any], bool], str], ...] = (
+    (
+        CONF_SCAN_INTERVAL,
+        lambda interval: 1 <= interval <= 86400,
+        "invalid_scan_interval",
+    ),
+    (
+        ConfName.SLEEP_AFTER_WRITE,
+        lambda sleep: 0 <= sleep <= 60,
+        "invalid_sleep_interval",
+    ),
+)
+
+BATTERY_OPTIONS_VALIDATORS: tuple[tuple[str, Callable[[Any], bool], str], ...] = (
+    (
+        ConfName.BATTERY_RATING_ADJUST,
+        lambda percent: 0 <= percent <= 100,
+        "invalid_percent",
+    ),
+)
+
+
+def validate_input(
+    user_input: dict[str, Any],
+    validators: tuple[tuple[str, Callable[[Any], bool], str], ...],
+) -> dict[str, str]:
+    """Return an errors dict with every field that fails validation."""
+    return {
+        field: error
+        for field, is_valid, error in validators
+        if not is_valid(user_input[field])
+    }
+
+
+def validate_hub_input(user_input: dict[str, Any]) -> dict[str, str]:
+    """Normalize hub connection input in place and return an errors dict.
+
+    On success the device list string is replaced by the parsed device ids.
+    """
+    user_input[CONF_HOST] = user_input[CONF_HOST].lower()
+    # str.split() drops the same unicode whitespace re's \s+ would match
+    user_input[ConfName.DEVICE_LIST] = "".join(user_input[ConfName.DEVICE_LIST].split())
+
+    errors = validate_input(user_input, CONFIG_VALIDATORS)
+
+    try:
+        device_list = device_list_from_string(user_input[ConfName.DEVICE_LIST])
+    except HomeAssistantError as e:
+        errors[ConfName.DEVICE_LIST] = f"{e}"
+    else:
+        if not 1 <= len(device_list) <= 32:
+            errors[ConfName.DEVICE_LIST] = "invalid_inverter_count"
+
+    if not errors:
+        user_input[ConfName.DEVICE_LIST] = device_list
+
+    return errors
+
+
+DEFAULT_USER_INPUT: dict[str, Any] = {
+    CONF_NAME: DEFAULT_NAME,
+    CONF_HOST: "",
+    CONF_PORT: ConfDefaultInt.PORT,
+    ConfName.DEVICE_LIST: ConfDefaultStr.DEVICE_LIST,
+}
+
+HUB_SCHEMA_FIELDS: tuple[tuple[str, Callable[[Any], Any]], ...] = (
+    (CONF_HOST, cv.string),
+    # range checked by port_valid so the error is translated
+    (CONF_PORT, vol.Coerce(int)),
+    (f"{ConfName.DEVICE_LIST}", cv.string),
+)
+
+# Form fields per step, built once and shared by every schema render.
+CONFIG_SCHEMA_FIELDS: dict[str, tuple[tuple[str, Callable[[Any], Any]], ...]] = {
+    "user": ((CONF_NAME, cv.string), *HUB_SCHEMA_FIELDS),
+    "reconfigure": HUB_SCHEMA_FIELDS,
+    "confirm": HUB_SCHEMA_FIELDS,
+}
+
+
+# Options flow form fields per step as (marker, field, validator).
+OPTIONS_SCHEMA_FIELDS: dict[
+    str, tuple[tuple[type[vol.Marker], str, Callable[[Any], Any]], ...]
+] = {
+    "init": (
+        (vol.Optional, CONF_SCAN_INTERVAL, vol.Coerce(int)),
+        (vol.Optional, f"{ConfName.KEEP_MODBUS_OPEN}", cv.boolean),
+        (vol.Optional, f"{ConfName.DETECT_METERS}", cv.boolean),
+        (vol.Optional, f"{ConfName.DETECT_BATTERIES}", cv.boolean),
+        (vol.Optional, f"{ConfName.DETECT_EXTRAS}", cv.boolean),
+        (vol.Optional, f"{ConfName.ADV_PWR_CONTROL}", cv.boolean),
+        (vol.Optional, f"{ConfName.SLEEP_AFTER_WRITE}", vol.Coerce(int)),
+    ),
+    "battery_options": (
+        (vol.Optional, f"{ConfName.ALLOW_BATTERY_ENERGY_RESET}", cv.boolean),
+        (vol.Optional, f"{ConfName.BATTERY_ENERGY_RESET_CYCLES}", cv.positive_int),
+        (vol.Optional, f"{ConfName.BATTERY_RATING_ADJUST}", vol.Coerce(int)),
+    ),
+    "adv_pwr_ctl": (
+        (vol.Required, f"{ConfName.ADV_STORAGE_CONTROL}", cv.boolean),
+        (vol.Required, f"{ConfName.ADV_SITE_LIMIT_CONTROL}", cv.boolean),
+    ),
+}
 
 
 def generate_config_schema(step_id: str, user_input: dict[str, Any]) -> vol.Schema:
     """Generate config flow or repair schema."""
-    schema: dict[vol.Marker, Any] = {}
-
-    if step_id == "user":
-        schema |= {vol.Required(CONF_NAME, default=user_input[CONF_NAME]): cv.string}
-
-    if step_id in ["reconfigure", "confirm", "user"]:
-        schema |= {
-            vol.Required(CONF_HOST, default=user_input[CONF_HOST]): cv.string,
-            vol.Required(CONF_PORT, default=user_input[CONF_PORT]): vol.Coerce(int),
-            vol.Required(
-                f"{ConfName.DEVICE_LIST}",
-                default=user_input[ConfName.DEVICE_LIST],
-            ): cv.string,
+    return vol.Schema(
+        {
+            vol.Required(field, default=user_input[field]): validator
+            for field, validator in CONFIG_SCHEMA_FIELDS.get(step_id, ())
         }
+    )
+
 
-    return vol.Schema(schema)
+def generate_options_schema(step_id: str, user_input: dict[str, Any]) -> vol.Schema:
+    """Generate options flow schema."""
+    return vol.Schema(
+        {
+            marker(field, default=user_input[field]): validator
+            for marker, field, validator in OPTIONS_SCHEMA_FIELDS.get(step_id, ())
+        }
+    )
 
 
 class SolaredgeModbusMultiConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -51,6 +173,9 @@ class SolaredgeModbusMultiConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 2
     MINOR_VERSION = 1
 
+    # (host, port) of existing entries, collected once per flow.
+    _configured_addresses: list[tuple[str, int]] | None = None
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
@@ -65,44 +190,38 @@ class SolaredgeModbusMultiConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             user_input[CONF_HOST] = user_input[CONF_HOST].lower()
-            user_input[ConfName.DEVICE_LIST] = re.sub(
-                r"\s+", "", user_input[ConfName.DEVICE_LIST], flags=re.UNICODE
+
+            await self.async_set_unique_id(
+                f"{user_input[CONF_HOST]}:{user_input[CONF_PORT]}"
             )
+            self._abort_if_unique_id_configured()
 
-            try:
-                inverter_count = len(
-                    device_list_from_string(user_input[ConfName.DEVICE_LIST])
-                )
-            except HomeAssistantError as e:
-                errors[ConfName.DEVICE_LIST] = f"{e}"
-
-            else:
-                if not host_valid(user_input[CONF_HOST]):
-                    errors[CONF_HOST] = "invalid_host"
-                elif not 1 <= user_input[CONF_PORT] <= 65535:
-                    errors[CONF_PORT] = "invalid_tcp_port"
-                elif not 1 <= inverter_count <= 32:
-                    errors[ConfName.DEVICE_LIST] = "invalid_inverter_count"
-                else:
-                    new_unique_id = f"{user_input[CONF_HOST]}:{user_input[CONF_PORT]}"
-                    await self.async_set_unique_id(new_unique_id)
+            errors = validate_hub_input(user_input)
 
-                    self._abort_if_unique_id_configured()
+            if not errors:
+                # Catch the same inverter entered by hostname and by IP.
+                if self._configured_addresses is None:
+                    self._configured_addresses = [
+                        (entry.data[CONF_HOST], entry.data.get(CONF_PORT))
+                        for entry in self._async_current_entries(include_ignore=False)
+                    ]
 
-                    user_input[ConfName.DEVICE_LIST] = device_list_from_string(
-                        user_input[ConfName.DEVICE_LIST]
-                    )
+                configured_hosts = [
+                    host
+                    for host, port in self._configured_addresses
+                    if port == user_input[CONF_PORT]
+                ]
 
-                    return self.async_create_entry(
-                        title=user_input[CONF_NAME], data=user_input
-                    )
+                if configured_hosts and await self.hass.async_add_executor_job(
+                    address_in_hosts, user_input[CONF_HOST], configured_hosts
+                ):
+                    return self.async_abort(reason="already_configured")
+
+                return self.async_create_entry(
+                    title=user_input[CONF_NAME], data=user_input
+                )
         else:
-            user_input = {
-                CONF_NAME: DEFAULT_NAME,
-                CONF_HOST: "",
-                CONF_PORT: ConfDefaultInt.PORT,
-                ConfName.DEVICE_LIST: ConfDefaultStr.DEVICE_LIST,
-            }
+            user_input = DEFAULT_USER_INPUT.copy()
 
         return self.async_show_form(
             step_id="user",
@@ -120,53 +239,31 @@ class SolaredgeModbusMultiConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
         if user_input is not None:
-            user_input[CONF_HOST] = user_input[CONF_HOST].lower()
-            user_input[ConfName.DEVICE_LIST] = re.sub(
-                r"\s+", "", user_input[ConfName.DEVICE_LIST], flags=re.UNICODE
-            )
+            errors = validate_hub_input(user_input)
 
-            try:
-                inverter_count = len(
-                    device_list_from_string(user_input[ConfName.DEVICE_LIST])
-                )
-            except HomeAssistantError as e:
-                errors[ConfName.DEVICE_LIST] = f"{e}"
-
-            else:
-                if not host_valid(user_input[CONF_HOST]):
-                    errors[CONF_HOST] = "invalid_host"
-                elif not 1 <= user_input[CONF_PORT] <= 65535:
-                    errors[CONF_PORT] = "invalid_tcp_port"
-                elif not 1 <= inverter_count <= 32:
-                    errors[ConfName.DEVICE_LIST] = "invalid_inverter_count"
-                else:
+            if not errors:
+                this_unique_id = f"{user_input[CONF_HOST]}:{user_input[CONF_PORT]}"
 
-                    user_input[ConfName.DEVICE_LIST] = device_list_from_string(
-                        user_input[ConfName.DEVICE_LIST]
+                if (
+                    this_unique_id != config_entry.unique_id
+                    and self.hass.config_entries.async_entry_for_domain_unique_id(
+                        DOMAIN, this_unique_id
                     )
-                    this_unique_id = f"{user_input[CONF_HOST]}:{user_input[CONF_PORT]}"
-
-                    if this_unique_id != config_entry.unique_id:
-                        self._async_abort_entries_match(
-                            {
-                                "host": user_input[CONF_HOST],
-                                "port": user_input[CONF_PORT],
-                            }
-                        )
-
-                    return self.async_update_reload_and_abort(
-                        config_entry,
-                        unique_id=this_unique_id,
-                        data={**config_entry.data, **user_input},
-                        reason="reconfigure_successful",
-                    )
-        else:
-            reconfig_device_list = ",".join(
-                str(device)
-                for device in config_entry.data.get(
-                    ConfName.DEVICE_LIST, ConfDefaultStr.DEVICE_LIST
+                    is not None
+                ):
+                    return self.async_abort(reason="already_configured")
+
+                return self.async_update_reload_and_abort(
+                    config_entry,
+                    unique_id=this_unique_id,
+                    data={**config_entry.data, **user_input},
+                    reason="reconfigure_successful",
                 )
+        else:
+            device_list = config_entry.data.get(
+                ConfName.DEVICE_LIST, ConfDefaultStr.DEVICE_LIST
             )
+            reconfig_device_list = ",".join(map(str, device_list))
 
             user_input = {
                 CONF_HOST: config_entry.data.get(CONF_HOST),
@@ -191,15 +288,9 @@ class SolaredgeModbusMultiOptionsFlowHandler(OptionsFlow):
         errors = {}
 
         if user_input is not None:
-            if user_input[CONF_SCAN_INTERVAL] < 1:
-                errors[CONF_SCAN_INTERVAL] = "invalid_scan_interval"
-            elif user_input[CONF_SCAN_INTERVAL] > 86400:
-                errors[CONF_SCAN_INTERVAL] = "invalid_scan_interval"
-            elif user_input[ConfName.SLEEP_AFTER_WRITE] < 0:
-                errors[ConfName.SLEEP_AFTER_WRITE] = "invalid_sleep_interval"
-            elif user_input[ConfName.SLEEP_AFTER_WRITE] > 60:
-                errors[ConfName.SLEEP_AFTER_WRITE] = "invalid_sleep_interval"
-            else:
+            errors = validate_input(user_input, OPTIONS_VALIDATORS)
+
+            if not errors:
                 if user_input[ConfName.DETECT_BATTERIES] is True:
                     self.init_info = user_input
                     return await self.async_step_battery_options()
@@ -238,38 +329,7 @@ class SolaredgeModbusMultiOptionsFlowHandler(OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_SCAN_INTERVAL,
-                        default=user_input[CONF_SCAN_INTERVAL],
-                    ): vol.Coerce(int),
-                    vol.Optional(
-                        f"{ConfName.KEEP_MODBUS_OPEN}",
-                        default=user_input[ConfName.KEEP_MODBUS_OPEN],
-                    ): cv.boolean,
-                    vol.Optional(
-                        f"{ConfName.DETECT_METERS}",
-                        default=user_input[ConfName.DETECT_METERS],
-                    ): cv.boolean,
-                    vol.Optional(
-                        f"{ConfName.DETECT_BATTERIES}",
-                        default=user_input[ConfName.DETECT_BATTERIES],
-                    ): cv.boolean,
-                    vol.Optional(
-                        f"{ConfName.DETECT_EXTRAS}",
-                        default=user_input[ConfName.DETECT_EXTRAS],
-                    ): cv.boolean,
-                    vol.Optional(
-                        f"{ConfName.ADV_PWR_CONTROL}",
-                        default=user_input[ConfName.ADV_PWR_CONTROL],
-                    ): cv.boolean,
-                    vol.Optional(
-                        f"{ConfName.SLEEP_AFTER_WRITE}",
-                        default=user_input[ConfName.SLEEP_AFTER_WRITE],
-                    ): vol.Coerce(int),
-                },
-            ),
+            data_schema=generate_options_schema("init", user_input),
             errors=errors,
         )
 
@@ -280,11 +340,9 @@ class SolaredgeModbusMultiOptionsFlowHandler(OptionsFlow):
         errors = {}
 
         if user_input is not None:
-            if user_input[ConfName.BATTERY_RATING_ADJUST] < 0:
-                errors[ConfName.BATTERY_RATING_ADJUST] = "invalid_percent"
-            elif user_input[ConfName.BATTERY_RATING_ADJUST] > 100:
-                errors[ConfName.BATTERY_RATING_ADJUST] = "invalid_percent"
-            else:
+            errors = validate_input(user_input, BATTERY_OPTIONS_VALIDATORS)
+
+            if not errors:
                 if self.init_info[ConfName.ADV_PWR_CONTROL] is True:
                     self.init_info = {**self.init_info, **user_input}
                     return await self.async_step_adv_pwr_ctl()
@@ -311,22 +369,7 @@ class SolaredgeModbusMultiOptionsFlowHandler(OptionsFlow):
 
         return self.async_show_form(
             step_id="battery_options",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        f"{ConfName.ALLOW_BATTERY_ENERGY_RESET}",
-                        default=user_input[ConfName.ALLOW_BATTERY_ENERGY_RESET],
-                    ): cv.boolean,
-                    vol.Optional(
-                        f"{ConfName.BATTERY_ENERGY_RESET_CYCLES}",
-                        default=user_input[ConfName.BATTERY_ENERGY_RESET_CYCLES],
-                    ): vol.Coerce(int),
-                    vol.Optional(
-                        f"{ConfName.BATTERY_RATING_ADJUST}",
-                        default=user_input[ConfName.BATTERY_RATING_ADJUST],
-                    ): vol.Coerce(int),
-                }
-            ),
+            data_schema=generate_options_schema("battery_options", user_input),
             errors=errors,
         )
 
@@ -355,17 +398,6 @@ class SolaredgeModbusMultiOptionsFlowHandler(OptionsFlow):
 
         return self.async_show_form(
             step_id="adv_pwr_ctl",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        f"{ConfName.ADV_STORAGE_CONTROL}",
-                        default=user_input[ConfName.ADV_STORAGE_CONTROL],
-                    ): cv.boolean,
-                    vol.Required(
-                        f"{ConfName.ADV_SITE_LIMIT_CONTROL}",
-                        default=user_input[ConfName.ADV_SITE_LIMIT_CONTROL],
-                    ): cv.boolean,
-                }
-            ),
+            data_schema=generate_options_schema("adv_pwr_ctl", user_input),
             errors=errors,
         )
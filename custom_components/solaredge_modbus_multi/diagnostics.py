@@ -34,7 +34,7 @@ async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, config_entry: ConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    hub = hass.data[DOMAIN][config_entry.entry_id]["hub"]
+    hub = hass.data[DOMAIN][config_entry.entry_id].hub
 
     data: dict[str, Any] = {
         "config_entry": async_redact_data(config_entry.as_dict(), REDACT_CONFIG),
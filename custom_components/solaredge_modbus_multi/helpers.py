@@ -1,27 +1,28 @@
 from __future__ import annotations
 
 import ipaddress
+import socket
 import struct
+from collections.abc import Mapping
+from functools import lru_cache
 
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import DOMAIN_REGEX
+from .const import HOSTNAME_REGEX, METER_EVENTS, MMPPT_EVENTS
 
 
-def float_to_hex(f):
+def float_to_hex(f: float) -> str:
     try:
         return hex(struct.unpack("<I", struct.pack("<f", f))[0])
     except struct.error as e:
         raise TypeError(e)
 
 
-def parse_modbus_string(s: str) -> str:
-    s = s.decode(encoding="utf-8", errors="ignore")
-    s = s.replace("\x00", "").rstrip()
-    return str(s)
+def parse_modbus_string(s: bytes) -> str:
+    return s.decode(encoding="utf-8", errors="ignore").replace("\x00", "").rstrip()
 
 
-def update_accum(self, accum_value: int) -> None:
+def update_accum(self, accum_value: int) -> int:
     if self.last is None:
         self.last = 0
 
@@ -37,14 +38,75 @@ def update_accum(self, accum_value: int) -> None:
         raise ValueError("update_accum must be an increasing value.")
 
 
-def host_valid(host):
+def event_names(bits: int, events: Mapping[int, str]) -> list[str]:
+    """Return the names of the set bits in an event register."""
+    names = []
+
+    # one iteration per set bit instead of one per bit position
+    while bits:
+        lowest_bit = bits & -bits
+        if (name := events.get(lowest_bit.bit_length() - 1)) is not None:
+            names.append(name)
+        bits ^= lowest_bit
+
+    return names
+
+
+@lru_cache(maxsize=64)
+def decode_meter_events(m_events: int) -> str:
+    """Return active meter events; flags are bits 2 through 30."""
+    return str(event_names(m_events & 0x7FFFFFFC, METER_EVENTS))
+
+
+@lru_cache(maxsize=64)
+def decode_mmppt_events(mmppt_events: int) -> str:
+    """Return active MMPPT events; flags are bits 0 through 30."""
+    return str(event_names(mmppt_events & 0x7FFFFFFF, MMPPT_EVENTS))
+
+
+def host_valid(host: str) -> bool:
     """Return True if hostname or IP address is valid."""
-    try:
-        if ipaddress.ip_address(host).version == (4 or 6):
+    if not host:
+        return False
+
+    # Only strings that can be an IP address are passed to ipaddress, so
+    # ordinary hostnames don't pay for a raised and caught ValueError.
+    if host[0].isdigit() or ":" in host:
+        try:
+            ipaddress.ip_address(host)
             return True
 
-    except ValueError:
-        return DOMAIN_REGEX.match(host)
+        except ValueError:
+            pass
+
+    return HOSTNAME_REGEX.fullmatch(host) is not None
+
+
+def resolve_host(host: str) -> frozenset[str]:
+    """Return the IPv4 and IPv6 addresses of a host, or the host itself
+    if it can't be resolved.
+
+    Not cached: addresses can change with DHCP or DNS updates.
+    Blocking: call from an executor job.
+    """
+    try:
+        return frozenset(
+            sockaddr[0]
+            for *_, sockaddr in socket.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)
+        )
+
+    except OSError:
+        return frozenset((host,))
+
+
+def address_in_hosts(host: str, hosts: list[str]) -> bool:
+    """Return True if host shares an address with any of hosts.
+
+    Blocking: call from an executor job.
+    """
+    addresses = resolve_host(host)
+
+    return any(not addresses.isdisjoint(resolve_host(other)) for other in hosts)
 
 
 def device_list_from_string(value: str) -> list[int]:
@@ -89,7 +151,7 @@ def device_list_from_string(value: str) -> list[int]:
     return sorted(set(ids))
 
 
-def check_device_id(value: str | int) -> int:
+def check_device_id(value: str) -> int:
     """The `check_device_id` function takes a value and checks if it is a valid device
     ID between 1 and 247, raising an error if it is not.
 
@@ -3,9 +3,11 @@ from __future__ import annotations
 import asyncio
 import importlib.metadata
 import logging
-from collections import OrderedDict
+from collections import ChainMap, OrderedDict
+from types import MappingProxyType
+from typing import Final
 
-from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT, CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir
@@ -32,9 +34,27 @@ from .const import (
 )
 from .helpers import float_to_hex, parse_modbus_string
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER: Final = logging.getLogger(__name__)
 pymodbus_version = importlib.metadata.version("pymodbus")
 
+# Hub settings read from config entry options, with their defaults.
+OPTION_DEFAULTS: Final = MappingProxyType(
+    {
+        ConfName.DETECT_METERS: bool(ConfDefaultFlag.DETECT_METERS),
+        ConfName.DETECT_BATTERIES: bool(ConfDefaultFlag.DETECT_BATTERIES),
+        ConfName.DETECT_EXTRAS: bool(ConfDefaultFlag.DETECT_EXTRAS),
+        ConfName.KEEP_MODBUS_OPEN: bool(ConfDefaultFlag.KEEP_MODBUS_OPEN),
+        ConfName.ADV_STORAGE_CONTROL: bool(ConfDefaultFlag.ADV_STORAGE_CONTROL),
+        ConfName.ADV_SITE_LIMIT_CONTROL: bool(ConfDefaultFlag.ADV_SITE_LIMIT_CONTROL),
+        ConfName.ALLOW_BATTERY_ENERGY_RESET: bool(
+            ConfDefaultFlag.ALLOW_BATTERY_ENERGY_RESET
+        ),
+        ConfName.SLEEP_AFTER_WRITE: ConfDefaultInt.SLEEP_AFTER_WRITE,
+        ConfName.BATTERY_RATING_ADJUST: ConfDefaultInt.BATTERY_RATING_ADJUST,
+        ConfName.BATTERY_ENERGY_RESET_CYCLES: ConfDefaultInt.BATTERY_ENERGY_RESET_CYCLES,
+    }
+)
+
 
 class SolarEdgeException(Exception):
     """Base class for other exceptions"""
@@ -120,51 +140,40 @@ class SolarEdgeModbusMultiHub:
         self._inverter_list = entry_data.get(
             ConfName.DEVICE_LIST, [ConfDefaultStr.DEVICE_LIST]
         )
-        self._detect_meters = entry_options.get(
-            ConfName.DETECT_METERS, bool(ConfDefaultFlag.DETECT_METERS)
-        )
-        self._detect_batteries = entry_options.get(
-            ConfName.DETECT_BATTERIES, bool(ConfDefaultFlag.DETECT_BATTERIES)
-        )
-        self._detect_extras = entry_options.get(
-            ConfName.DETECT_EXTRAS, bool(ConfDefaultFlag.DETECT_EXTRAS)
-        )
-        self._keep_modbus_open = entry_options.get(
-            ConfName.KEEP_MODBUS_OPEN, bool(ConfDefaultFlag.KEEP_MODBUS_OPEN)
-        )
-        self._adv_storage_control = entry_options.get(
-            ConfName.ADV_STORAGE_CONTROL, bool(ConfDefaultFlag.ADV_STORAGE_CONTROL)
-        )
-        self._adv_site_limit_control = entry_options.get(
-            ConfName.ADV_SITE_LIMIT_CONTROL,
-            bool(ConfDefaultFlag.ADV_SITE_LIMIT_CONTROL),
-        )
-        self._allow_battery_energy_reset = entry_options.get(
-            ConfName.ALLOW_BATTERY_ENERGY_RESET,
-            bool(ConfDefaultFlag.ALLOW_BATTERY_ENERGY_RESET),
-        )
-        self._sleep_after_write = entry_options.get(
-            ConfName.SLEEP_AFTER_WRITE, ConfDefaultInt.SLEEP_AFTER_WRITE
-        )
-        self._battery_rating_adjust = entry_options.get(
-            ConfName.BATTERY_RATING_ADJUST, ConfDefaultInt.BATTERY_RATING_ADJUST
-        )
-        self._battery_energy_reset_cycles = entry_options.get(
-            ConfName.BATTERY_ENERGY_RESET_CYCLES,
-            ConfDefaultInt.BATTERY_ENERGY_RESET_CYCLES,
-        )
+        options = ChainMap(entry_options, OPTION_DEFAULTS)
+        self._detect_meters = options[ConfName.DETECT_METERS]
+        self._detect_batteries = options[ConfName.DETECT_BATTERIES]
+        self._detect_extras = options[ConfName.DETECT_EXTRAS]
+        self._keep_modbus_open = options[ConfName.KEEP_MODBUS_OPEN]
+
+        # Reconnecting more than once a minute costs more than holding the
+        # socket open between polls, but some inverters only accept one
+        # Modbus/TCP client, so an explicit choice in the options wins.
+        if ConfName.KEEP_MODBUS_OPEN not in entry_options and (
+            entry_options.get(CONF_SCAN_INTERVAL, ConfDefaultInt.SCAN_INTERVAL) < 60
+        ):
+            self._keep_modbus_open = True
+
+        self._adv_storage_control = options[ConfName.ADV_STORAGE_CONTROL]
+        self._adv_site_limit_control = options[ConfName.ADV_SITE_LIMIT_CONTROL]
+        self._allow_battery_energy_reset = options[ConfName.ALLOW_BATTERY_ENERGY_RESET]
+        self._sleep_after_write = options[ConfName.SLEEP_AFTER_WRITE]
+        self._battery_rating_adjust = options[ConfName.BATTERY_RATING_ADJUST]
+        self._battery_energy_reset_cycles = options[
+            ConfName.BATTERY_ENERGY_RESET_CYCLES
+        ]
+
+        modbus_config = self._yaml_config.get("modbus", {})
         self._retry_limit = self._yaml_config.get("retry", {}).get(
             "limit", RetrySettings.Limit
         )
-        self._mb_reconnect_delay = self._yaml_config.get("modbus", {}).get(
+        self._mb_reconnect_delay = modbus_config.get(
             "reconnect_delay", ModbusDefaults.ReconnectDelay
         )
-        self._mb_reconnect_delay_max = self._yaml_config.get("modbus", {}).get(
+        self._mb_reconnect_delay_max = modbus_config.get(
             "reconnect_delay_max", ModbusDefaults.ReconnectDelayMax
         )
-        self._mb_timeout = self._yaml_config.get("modbus", {}).get(
-            "timeout", ModbusDefaults.Timeout
-        )
+        self._mb_timeout = modbus_config.get("timeout", ModbusDefaults.Timeout)
         self._id = entry_data[CONF_NAME].lower()
         self._lock = asyncio.Lock()
         self.inverters = []
@@ -173,6 +182,8 @@ class SolarEdgeModbusMultiHub:
         self.inverter_common = {}
         self.mmppt_common = {}
         self.has_write = None
+        self._write_done = asyncio.Event()
+        self._write_done.set()
 
         self._initalized = False
         self._online = True
@@ -409,10 +420,8 @@ class SolarEdgeModbusMultiHub:
                 async with asyncio.timeout(self.coordinator_timeout):
                     for inverter in self.inverters:
                         await inverter.read_modbus_data()
-                    for meter in self.meters:
-                        await meter.read_modbus_data()
-                    for battery in self.batteries:
-                        await battery.read_modbus_data()
+                    for device in (*self.meters, *self.batteries):
+                        await self._refresh_device(device)
 
             except ModbusReadError as e:
                 self.disconnect()
@@ -456,6 +465,36 @@ class SolarEdgeModbusMultiHub:
 
             return True
 
+    async def wait_for_write(self) -> None:
+        """Wait for an in-progress write to finish its sleep after write."""
+        await self._write_done.wait()
+
+    async def _refresh_device(self, device: SolarEdgeMeter | SolarEdgeBattery) -> None:
+        """Read a meter or battery, failing only that device on error."""
+
+        # an earlier failed device may have dropped the connection
+        if not self.is_connected:
+            await self.connect()
+
+        try:
+            async with asyncio.timeout(self.device_timeout):
+                await device.read_modbus_data()
+
+        except TimeoutError as e:
+            # a late response to the cancelled request must not be matched
+            # to the next one, so start over with a new client
+            self.disconnect(clear_client=True)
+            _LOGGER.debug(f"Marking {device.uid_base} unavailable: timeout {e}")
+            device.read_ok = False
+
+        except (ModbusReadError, DeviceInvalid) as e:
+            self.disconnect()
+            _LOGGER.debug(f"Marking {device.uid_base} unavailable: {e}")
+            device.read_ok = False
+
+        else:
+            device.read_ok = True
+
     async def connect(self) -> None:
         """Connect to inverter."""
 
@@ -562,14 +601,20 @@ class SolarEdgeModbusMultiHub:
                 )
 
                 self.has_write = address
+                self._write_done.clear()
 
-                if self.sleep_after_write > 0:
-                    _LOGGER.debug(
-                        f"Sleep {self.sleep_after_write} seconds after write {address}."
-                    )
-                    await asyncio.sleep(self.sleep_after_write)
+                try:
+                    if self.sleep_after_write > 0:
+                        _LOGGER.debug(
+                            f"Sleep {self.sleep_after_write} seconds "
+                            f"after write {address}."
+                        )
+                        await asyncio.sleep(self.sleep_after_write)
+
+                finally:
+                    self.has_write = None
+                    self._write_done.set()
 
-                self.has_write = None
                 _LOGGER.debug(f"Finished with write {address}.")
 
             except ModbusIOException as e:
@@ -730,14 +775,26 @@ class SolarEdgeModbusMultiHub:
 
         else:
             this_timeout = SolarEdgeTimeouts.Inverter * self.number_of_inverters
-            this_timeout += SolarEdgeTimeouts.Device * self.number_of_meters
-            this_timeout += SolarEdgeTimeouts.Device * self.number_of_batteries
+            this_timeout += (
+                self.device_timeout
+                * 1000
+                * (self.number_of_meters + self.number_of_batteries)
+            )
 
         this_timeout = this_timeout / 1000
 
         _LOGGER.debug(f"coordinator timeout is {this_timeout}")
         return this_timeout
 
+    @property
+    def device_timeout(self) -> float:
+        """Time limit in seconds for one meter or battery read.
+
+        Never shorter than the modbus request timeout, so slow devices
+        behind the inverter get the same time as any other request.
+        """
+        return max(SolarEdgeTimeouts.Device / 1000, self._mb_timeout)
+
     @property
     def is_connected(self) -> bool:
         """Check modbus client connection status."""
@@ -753,6 +810,7 @@ class SolarEdgeInverter:
     def __init__(self, device_id: int, hub: SolarEdgeModbusMultiHub) -> None:
         self.inverter_unit_id = device_id
         self.hub = hub
+        self._device_info = None
         self.mmppt_units = []
         self.decoded_common = []
         self.decoded_model = []
@@ -899,8 +957,9 @@ class SolarEdgeInverter:
         """Read and update dynamic modbus registers."""
 
         try:
+            # C_Version through the end of the inverter model in one request
             inverter_data = await self.hub.modbus_read_holding_registers(
-                unit=self.inverter_unit_id, address=40044, rcount=16
+                unit=self.inverter_unit_id, address=40044, rcount=65
             )
 
             decoder = BinaryPayloadDecoder.fromRegisters(
@@ -911,13 +970,8 @@ class SolarEdgeInverter:
                 decoder.decode_string(16)
             )
 
-            inverter_data = await self.hub.modbus_read_holding_registers(
-                unit=self.inverter_unit_id, address=40069, rcount=40
-            )
-
-            decoder = BinaryPayloadDecoder.fromRegisters(
-                inverter_data.registers, byteorder=Endian.BIG
-            )
+            # C_SerialNumber and C_DeviceAddress, read once at init
+            decoder.skip_bytes(34)
 
             self.decoded_model = OrderedDict(
                 [
@@ -1444,16 +1498,22 @@ class SolarEdgeInverter:
 
     @property
     def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.uid_base)},
-            name=self.name,
-            manufacturer=self.manufacturer,
-            model=self.model,
-            serial_number=self.serial,
-            sw_version=self.fw_version,
-            hw_version=self.option,
-        )
+        """Return the device info, shared by all entities of this device."""
+        if (
+            self._device_info is None
+            or self._device_info["sw_version"] != self.fw_version
+        ):
+            self._device_info = DeviceInfo(
+                identifiers={(DOMAIN, self.uid_base)},
+                name=self.name,
+                manufacturer=self.manufacturer,
+                model=self.model,
+                serial_number=self.serial,
+                sw_version=self.fw_version,
+                hw_version=self.option,
+            )
+
+        return self._device_info
 
     @property
     def is_mmppt(self) -> bool:
@@ -1509,6 +1569,7 @@ class SolarEdgeMeter:
     ) -> None:
         self.inverter_unit_id = device_id
         self.hub = hub
+        self._device_info = None
         self.decoded_common = []
         self.decoded_model = []
         self.meter_id = meter_id
@@ -1516,6 +1577,7 @@ class SolarEdgeMeter:
         self.inverter_common = self.hub.inverter_common[self.inverter_unit_id]
         self.mmppt_common = self.hub.mmppt_common[self.inverter_unit_id]
         self._via_device = None
+        self.read_ok = True
 
         try:
             self.start_address = METER_REG_BASE[self.meter_id]
@@ -1722,22 +1784,28 @@ class SolarEdgeMeter:
 
     @property
     def online(self) -> bool:
-        """Device is online."""
-        return self.hub.online
+        """Device is online and its last read succeeded."""
+        return self.hub.online and self.read_ok
 
     @property
     def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.uid_base)},
-            name=self.name,
-            manufacturer=self.manufacturer,
-            model=self.model,
-            serial_number=self.serial,
-            sw_version=self.fw_version,
-            hw_version=self.option,
-            via_device=self.via_device,
-        )
+        """Return the device info, shared by all entities of this device."""
+        if (
+            self._device_info is None
+            or self._device_info["sw_version"] != self.fw_version
+        ):
+            self._device_info = DeviceInfo(
+                identifiers={(DOMAIN, self.uid_base)},
+                name=self.name,
+                manufacturer=self.manufacturer,
+                model=self.model,
+                serial_number=self.serial,
+                sw_version=self.fw_version,
+                hw_version=self.option,
+                via_device=self.via_device,
+            )
+
+        return self._device_info
 
     @property
     def via_device(self) -> tuple[str, str]:
@@ -1746,6 +1814,7 @@ class SolarEdgeMeter:
     @via_device.setter
     def via_device(self, device: str) -> None:
         self._via_device = (DOMAIN, device)
+        self._device_info = None
 
 
 class SolarEdgeBattery:
@@ -1756,6 +1825,7 @@ class SolarEdgeBattery:
     ) -> None:
         self.inverter_unit_id = device_id
         self.hub = hub
+        self._device_info = None
         self.decoded_common = []
         self.decoded_model = []
         self.start_address = None
@@ -1763,6 +1833,7 @@ class SolarEdgeBattery:
         self.has_parent = True
         self.inverter_common = self.hub.inverter_common[self.inverter_unit_id]
         self._via_device = None
+        self.read_ok = True
 
         try:
             self.start_address = BATTERY_REG_BASE[self.battery_id]
@@ -1938,21 +2009,27 @@ class SolarEdgeBattery:
 
     @property
     def online(self) -> bool:
-        """Device is online."""
-        return self.hub.online
+        """Device is online and its last read succeeded."""
+        return self.hub.online and self.read_ok
 
     @property
     def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.uid_base)},
-            name=self.name,
-            manufacturer=self.manufacturer,
-            model=self.model,
-            serial_number=self.serial,
-            sw_version=self.fw_version,
-            via_device=self.via_device,
-        )
+        """Return the device info, shared by all entities of this device."""
+        if (
+            self._device_info is None
+            or self._device_info["sw_version"] != self.fw_version
+        ):
+            self._device_info = DeviceInfo(
+                identifiers={(DOMAIN, self.uid_base)},
+                name=self.name,
+                manufacturer=self.manufacturer,
+                model=self.model,
+                serial_number=self.serial,
+                sw_version=self.fw_version,
+                via_device=self.via_device,
+            )
+
+        return self._device_info
 
     @property
     def via_device(self) -> tuple[str, str]:
@@ -1961,6 +2038,7 @@ class SolarEdgeBattery:
     @via_device.setter
     def via_device(self, device: str) -> None:
         self._via_device = (DOMAIN, device)
+        self._device_info = None
 
     @property
     def allow_battery_energy_reset(self) -> bool:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Final
 
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
@@ -21,7 +22,7 @@ from pymodbus.payload import BinaryPayloadBuilder
 from .const import DOMAIN, BatteryLimit, SunSpecNotImpl
 from .helpers import float_to_hex
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER: Final = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
@@ -29,8 +30,9 @@ async def async_setup_entry(
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    hub = hass.data[DOMAIN][config_entry.entry_id]["hub"]
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    runtime_data = hass.data[DOMAIN][config_entry.entry_id]
+    hub = runtime_data.hub
+    coordinator = runtime_data.coordinator
 
     entities = []
 
@@ -74,13 +76,6 @@ async def async_setup_entry(
         async_add_entities(entities)
 
 
-def get_key(d, search):
-    for k, v in d.items():
-        if v == search:
-            return k
-    return None
-
-
 class SolarEdgeNumberBase(CoordinatorEntity, NumberEntity):
     should_poll = False
     _attr_has_entity_name = True
@@ -92,10 +87,8 @@ class SolarEdgeNumberBase(CoordinatorEntity, NumberEntity):
         """Initialize the number."""
         self._platform = platform
         self._config_entry = config_entry
-
-    @property
-    def device_info(self):
-        return self._platform.device_info
+        self._attr_device_info = platform.device_info
+        self._attr_unique_id = f"{platform.uid_base}{self._unique_id_suffix}"
 
     @property
     def config_entry_id(self):
@@ -116,14 +109,8 @@ class SolarEdgeNumberBase(CoordinatorEntity, NumberEntity):
 
 class StorageACChargeLimit(SolarEdgeNumberBase):
     icon = "mdi:lightning-bolt"
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_storage_ac_charge_limit"
-
-    @property
-    def name(self) -> str:
-        return "AC Charge Limit"
+    _attr_name = "AC Charge Limit"
+    _unique_id_suffix = "_storage_ac_charge_limit"
 
     @property
     def entity_registry_enabled_default(self) -> bool:
@@ -193,14 +180,8 @@ class StorageBackupReserve(SolarEdgeNumberBase):
     native_min_value = 0
     native_max_value = 100
     icon = "mdi:battery-positive"
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_storage_backup_reserve"
-
-    @property
-    def name(self) -> str:
-        return "Backup Reserve"
+    _attr_name = "Backup Reserve"
+    _unique_id_suffix = "_storage_backup_reserve"
 
     @property
     def entity_registry_enabled_default(self) -> bool:
@@ -244,14 +225,8 @@ class StorageCommandTimeout(SolarEdgeNumberBase):
     native_max_value = 86400  # 24h
     native_unit_of_measurement = UnitOfTime.SECONDS
     icon = "mdi:clock-end"
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_storage_command_timeout"
-
-    @property
-    def name(self) -> str:
-        return "Storage Command Timeout"
+    _attr_name = "Storage Command Timeout"
+    _unique_id_suffix = "_storage_command_timeout"
 
     @property
     def entity_registry_enabled_default(self) -> bool:
@@ -296,14 +271,8 @@ class StorageChargeLimit(SolarEdgeNumberBase):
     native_step = 1.0
     native_unit_of_measurement = UnitOfPower.WATT
     icon = "mdi:lightning-bolt"
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_storage_charge_limit"
-
-    @property
-    def name(self) -> str:
-        return "Storage Charge Limit"
+    _attr_name = "Storage Charge Limit"
+    _unique_id_suffix = "_storage_charge_limit"
 
     @property
     def available(self) -> bool:
@@ -348,14 +317,8 @@ class StorageDischargeLimit(SolarEdgeNumberBase):
     native_step = 1.0
     native_unit_of_measurement = UnitOfPower.WATT
     icon = "mdi:lightning-bolt"
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_storage_discharge_limit"
-
-    @property
-    def name(self) -> str:
-        return "Storage Discharge Limit"
+    _attr_name = "Storage Discharge Limit"
+    _unique_id_suffix = "_storage_discharge_limit"
 
     @property
     def available(self) -> bool:
@@ -402,14 +365,8 @@ class SolarEdgeSiteLimit(SolarEdgeNumberBase):
     native_max_value = 1000000
     native_unit_of_measurement = UnitOfPower.WATT
     icon = "mdi:lightning-bolt"
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_site_limit"
-
-    @property
-    def name(self) -> str:
-        return "Site Limit"
+    _attr_name = "Site Limit"
+    _unique_id_suffix = "_site_limit"
 
     @property
     def available(self) -> bool:
@@ -450,14 +407,8 @@ class SolarEdgeExternalProductionMax(SolarEdgeNumberBase):
     native_max_value = 1000000
     native_unit_of_measurement = UnitOfPower.WATT
     icon = "mdi:lightning-bolt"
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_external_production_max"
-
-    @property
-    def name(self) -> str:
-        return "External Production Max"
+    _attr_name = "External Production Max"
+    _unique_id_suffix = "_external_production_max"
 
     @property
     def available(self) -> bool:
@@ -503,14 +454,8 @@ class SolarEdgeActivePowerLimitSet(SolarEdgeNumberBase):
     native_max_value = 100
     mode = "slider"
     icon = "mdi:percent"
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_active_power_limit_set"
-
-    @property
-    def name(self) -> str:
-        return "Active Power Limit"
+    _attr_name = "Active Power Limit"
+    _unique_id_suffix = "_active_power_limit_set"
 
     @property
     def entity_registry_enabled_default(self) -> bool:
@@ -553,14 +498,8 @@ class SolarEdgeCosPhiSet(SolarEdgeNumberBase):
     native_step = 0.1
     mode = "slider"
     icon = "mdi:angle-acute"
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_cosphi_set"
-
-    @property
-    def name(self) -> str:
-        return "CosPhi"
+    _attr_name = "CosPhi"
+    _unique_id_suffix = "_cosphi_set"
 
     @property
     def entity_registry_enabled_default(self) -> bool:
@@ -604,14 +543,8 @@ class SolarEdgePowerReduce(SolarEdgeNumberBase):
     native_max_value = 100
     mode = "slider"
     icon = "mdi:percent"
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_power_reduce"
-
-    @property
-    def name(self) -> str:
-        return "Power Reduce"
+    _attr_name = "Power Reduce"
+    _unique_id_suffix = "_power_reduce"
 
     @property
     def entity_registry_enabled_default(self) -> bool:
@@ -654,14 +587,8 @@ class SolarEdgeCurrentLimit(SolarEdgeNumberBase):
     native_min_value = 0
     native_max_value = 256
     icon = "mdi:current-ac"
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_max_current"
-
-    @property
-    def name(self) -> str:
-        return "Current Limit"
+    _attr_name = "Current Limit"
+    _unique_id_suffix = "_max_current"
 
     @property
     def entity_registry_enabled_default(self) -> bool:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
+from typing import Final
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
@@ -22,7 +24,7 @@ from .const import (
     SunSpecNotImpl,
 )
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER: Final = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
@@ -30,8 +32,9 @@ async def async_setup_entry(
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    hub = hass.data[DOMAIN][config_entry.entry_id]["hub"]
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    runtime_data = hass.data[DOMAIN][config_entry.entry_id]
+    hub = runtime_data.hub
+    coordinator = runtime_data.coordinator
 
     entities = []
 
@@ -60,13 +63,6 @@ async def async_setup_entry(
         async_add_entities(entities)
 
 
-def get_key(d, search):
-    for k, v in d.items():
-        if v == search:
-            return k
-    return None
-
-
 class SolarEdgeSelectBase(CoordinatorEntity, SelectEntity):
     should_poll = False
     _attr_has_entity_name = True
@@ -78,10 +74,8 @@ class SolarEdgeSelectBase(CoordinatorEntity, SelectEntity):
         """Initialize the sensor."""
         self._platform = platform
         self._config_entry = config_entry
-
-    @property
-    def device_info(self):
-        return self._platform.device_info
+        self._attr_device_info = platform.device_info
+        self._attr_unique_id = f"{platform.uid_base}{self._unique_id_suffix}"
 
     @property
     def config_entry_id(self):
@@ -95,25 +89,25 @@ class SolarEdgeSelectBase(CoordinatorEntity, SelectEntity):
     def available(self) -> bool:
         return super().available and self._platform.online
 
+    @cached_property
+    def _option_keys(self) -> dict:
+        """Map option names back to their register values."""
+        return {value: key for key, value in self._options.items()}
+
     @callback
     def _handle_coordinator_update(self) -> None:
         self.async_write_ha_state()
 
 
 class StorageControlMode(SolarEdgeSelectBase):
+    _attr_name = "Storage Control Mode"
+    _unique_id_suffix = "_storage_control_mode"
+
     def __init__(self, platform, config_entry, coordinator):
         super().__init__(platform, config_entry, coordinator)
         self._options = STORAGE_CONTROL_MODE
         self._attr_options = list(self._options.values())
 
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_storage_control_mode"
-
-    @property
-    def name(self) -> str:
-        return "Storage Control Mode"
-
     @property
     def entity_registry_enabled_default(self) -> bool:
         return self._platform.has_battery is True
@@ -141,25 +135,20 @@ class StorageControlMode(SolarEdgeSelectBase):
 
     async def async_select_option(self, option: str) -> None:
         _LOGGER.debug(f"set {self.unique_id} to {option}")
-        new_mode = get_key(self._options, option)
+        new_mode = self._option_keys[option]
         await self._platform.write_registers(address=57348, payload=new_mode)
         await self.async_update()
 
 
 class StorageACChargePolicy(SolarEdgeSelectBase):
+    _attr_name = "AC Charge Policy"
+    _unique_id_suffix = "_ac_charge_policy"
+
     def __init__(self, platform, config_entry, coordinator):
         super().__init__(platform, config_entry, coordinator)
         self._options = STORAGE_AC_CHARGE_POLICY
         self._attr_options = list(self._options.values())
 
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_ac_charge_policy"
-
-    @property
-    def name(self) -> str:
-        return "AC Charge Policy"
-
     @property
     def entity_registry_enabled_default(self) -> bool:
         return self._platform.has_battery is True
@@ -187,25 +176,20 @@ class StorageACChargePolicy(SolarEdgeSelectBase):
 
     async def async_select_option(self, option: str) -> None:
         _LOGGER.debug(f"set {self.unique_id} to {option}")
-        new_mode = get_key(self._options, option)
+        new_mode = self._option_keys[option]
         await self._platform.write_registers(address=57349, payload=new_mode)
         await self.async_update()
 
 
 class StorageDefaultMode(SolarEdgeSelectBase):
+    _attr_name = "Storage Default Mode"
+    _unique_id_suffix = "_storage_default_mode"
+
     def __init__(self, platform, config_entry, coordinator):
         super().__init__(platform, config_entry, coordinator)
         self._options = STORAGE_MODE
         self._attr_options = list(self._options.values())
 
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_storage_default_mode"
-
-    @property
-    def name(self) -> str:
-        return "Storage Default Mode"
-
     @property
     def entity_registry_enabled_default(self) -> bool:
         return self._platform.has_battery is True
@@ -237,25 +221,20 @@ class StorageDefaultMode(SolarEdgeSelectBase):
 
     async def async_select_option(self, option: str) -> None:
         _LOGGER.debug(f"set {self.unique_id} to {option}")
-        new_mode = get_key(self._options, option)
+        new_mode = self._option_keys[option]
         await self._platform.write_registers(address=57354, payload=new_mode)
         await self.async_update()
 
 
 class StorageCommandMode(SolarEdgeSelectBase):
+    _attr_name = "Storage Command Mode"
+    _unique_id_suffix = "_storage_command_mode"
+
     def __init__(self, platform, config_entry, coordinator):
         super().__init__(platform, config_entry, coordinator)
         self._options = STORAGE_MODE
         self._attr_options = list(self._options.values())
 
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_storage_command_mode"
-
-    @property
-    def name(self) -> str:
-        return "Storage Command Mode"
-
     @property
     def entity_registry_enabled_default(self) -> bool:
         return self._platform.has_battery is True
@@ -287,12 +266,15 @@ class StorageCommandMode(SolarEdgeSelectBase):
 
     async def async_select_option(self, option: str) -> None:
         _LOGGER.debug(f"set {self.unique_id} to {option}")
-        new_mode = get_key(self._options, option)
+        new_mode = self._option_keys[option]
         await self._platform.write_registers(address=57357, payload=new_mode)
         await self.async_update()
 
 
 class SolaredgeLimitControlMode(SolarEdgeSelectBase):
+    _attr_name = "Limit Control Mode"
+    _unique_id_suffix = "_limit_control_mode"
+
     def __init__(self, platform, config_entry, coordinator):
         super().__init__(platform, config_entry, coordinator)
         self._options = LIMIT_CONTROL_MODE
@@ -309,14 +291,6 @@ class SolaredgeLimitControlMode(SolarEdgeSelectBase):
         except KeyError:
             return False
 
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_limit_control_mode"
-
-    @property
-    def name(self) -> str:
-        return "Limit Control Mode"
-
     @property
     def current_option(self) -> str:
         if (int(self._platform.decoded_model["E_Lim_Ctl_Mode"]) >> 0) & 1:
@@ -333,7 +307,7 @@ class SolaredgeLimitControlMode(SolarEdgeSelectBase):
 
     async def async_select_option(self, option: str) -> None:
         set_bits = int(self._platform.decoded_model["E_Lim_Ctl_Mode"])
-        new_mode = get_key(self._options, option)
+        new_mode = self._option_keys[option]
 
         set_bits = set_bits & ~(1 << 0)
         set_bits = set_bits & ~(1 << 1)
@@ -348,6 +322,9 @@ class SolaredgeLimitControlMode(SolarEdgeSelectBase):
 
 
 class SolaredgeLimitControl(SolarEdgeSelectBase):
+    _attr_name = "Limit Control"
+    _unique_id_suffix = "_limit_control"
+
     def __init__(self, platform, config_entry, coordinator):
         super().__init__(platform, config_entry, coordinator)
         self._options = LIMIT_CONTROL
@@ -364,26 +341,21 @@ class SolaredgeLimitControl(SolarEdgeSelectBase):
         except KeyError:
             return False
 
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_limit_control"
-
-    @property
-    def name(self) -> str:
-        return "Limit Control"
-
     @property
     def current_option(self) -> str:
         return self._options[self._platform.decoded_model["E_Lim_Ctl"]]
 
     async def async_select_option(self, option: str) -> None:
         _LOGGER.debug(f"set {self.unique_id} to {option}")
-        new_mode = get_key(self._options, option)
+        new_mode = self._option_keys[option]
         await self._platform.write_registers(address=57345, payload=new_mode)
         await self.async_update()
 
 
 class SolarEdgeReactivePowerMode(SolarEdgeSelectBase):
+    _attr_name = "Reactive Power Mode"
+    _unique_id_suffix = "_reactive_power_mode"
+
     def __init__(self, platform, config_entry, coordinator):
         super().__init__(platform, config_entry, coordinator)
         self._options = REACTIVE_POWER_CONFIG
@@ -405,21 +377,13 @@ class SolarEdgeReactivePowerMode(SolarEdgeSelectBase):
         except KeyError:
             return False
 
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_reactive_power_mode"
-
-    @property
-    def name(self) -> str:
-        return "Reactive Power Mode"
-
     @property
     def current_option(self) -> str:
         return self._options[self._platform.decoded_model["ReactivePwrConfig"]]
 
     async def async_select_option(self, option: str) -> None:
         _LOGGER.debug(f"set {self.unique_id} to {option}")
-        new_mode = get_key(self._options, option)
+        new_mode = self._option_keys[option]
         builder = BinaryPayloadBuilder(byteorder=Endian.BIG, wordorder=Endian.LITTLE)
         builder.add_32bit_int(int(new_mode))
         await self._platform.write_registers(
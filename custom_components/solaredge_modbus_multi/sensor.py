@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-import re
+from typing import Final
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -33,8 +33,6 @@ from .const import (
     DOMAIN,
     ENERGY_VOLT_AMPERE_HOUR,
     ENERGY_VOLT_AMPERE_REACTIVE_HOUR,
-    METER_EVENTS,
-    MMPPT_EVENTS,
     RRCR_STATUS,
     SUNSPEC_DID,
     SUNSPEC_SF_RANGE,
@@ -43,9 +41,35 @@ from .const import (
     SunSpecAccum,
     SunSpecNotImpl,
 )
-from .helpers import float_to_hex, update_accum
+from .helpers import (
+    decode_meter_events,
+    decode_mmppt_events,
+    float_to_hex,
+    update_accum,
+)
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+# Phase suffixes for meters, which create one sensor per suffix.
+PHASES = (None, "A", "B", "C")
+METER_VOLTAGE_PHASES = ("LN", "AN", "BN", "CN", "LL", "AB", "BC", "CA")
+METER_ENERGY_PHASES = tuple(
+    f"{direction}{phase}"
+    for direction in ("Exported", "Imported")
+    for phase in ("", "_A", "_B", "_C")
+)
+METER_VARH_PHASES = tuple(
+    f"{quadrant}{phase}"
+    for quadrant in ("Import_Q1", "Import_Q2", "Export_Q3", "Export_Q4")
+    for phase in ("", "_A", "_B", "_C")
+)
 
-_LOGGER = logging.getLogger(__name__)
+# Icons for accumulators keyed by the first six letters of their phase,
+# "Imported_A" and "Import_Q1" -> "import".
+ENERGY_DIRECTION_ICONS = {
+    "import": "mdi:transmission-tower-export",
+    "export": "mdi:transmission-tower-import",
+}
 
 
 async def async_setup_entry(
@@ -53,37 +77,22 @@ async def async_setup_entry(
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    hub = hass.data[DOMAIN][config_entry.entry_id]["hub"]
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    runtime_data = hass.data[DOMAIN][config_entry.entry_id]
+    hub = runtime_data.hub
+    coordinator = runtime_data.coordinator
 
     entities = []
 
-    for inverter in hub.inverters:
-        entities.append(SolarEdgeDevice(inverter, config_entry, coordinator))
-        entities.append(Version(inverter, config_entry, coordinator))
-        entities.append(SolarEdgeInverterStatus(inverter, config_entry, coordinator))
-        entities.append(StatusVendor(inverter, config_entry, coordinator))
-        entities.append(ACCurrentSensor(inverter, config_entry, coordinator))
-        entities.append(ACCurrentSensor(inverter, config_entry, coordinator, "A"))
-        entities.append(ACCurrentSensor(inverter, config_entry, coordinator, "B"))
-        entities.append(ACCurrentSensor(inverter, config_entry, coordinator, "C"))
-        entities.append(VoltageSensor(inverter, config_entry, coordinator, "AB"))
-        entities.append(VoltageSensor(inverter, config_entry, coordinator, "BC"))
-        entities.append(VoltageSensor(inverter, config_entry, coordinator, "CA"))
-        entities.append(VoltageSensor(inverter, config_entry, coordinator, "AN"))
-        entities.append(VoltageSensor(inverter, config_entry, coordinator, "BN"))
-        entities.append(VoltageSensor(inverter, config_entry, coordinator, "CN"))
-        entities.append(ACPower(inverter, config_entry, coordinator))
-        entities.append(ACFrequency(inverter, config_entry, coordinator))
-        entities.append(ACVoltAmp(inverter, config_entry, coordinator))
-        entities.append(ACVoltAmpReactive(inverter, config_entry, coordinator))
-        entities.append(ACPowerFactor(inverter, config_entry, coordinator))
-        entities.append(SolarEdgeACEnergy(inverter, config_entry, coordinator))
-        entities.append(DCCurrent(inverter, config_entry, coordinator))
-        entities.append(DCVoltage(inverter, config_entry, coordinator))
-        entities.append(DCPower(inverter, config_entry, coordinator))
-        entities.append(HeatSinkTemperature(inverter, config_entry, coordinator))
+    for devices, sensor_specs in (
+        (hub.inverters, INVERTER_SENSORS),
+        (hub.meters, METER_SENSORS),
+        (hub.batteries, BATTERY_SENSORS),
+    ):
+        for device in devices:
+            for sensor_class, *args in sensor_specs:
+                entities.append(sensor_class(device, config_entry, coordinator, *args))
 
+    for inverter in hub.inverters:
         if hub.option_detect_extras:
             entities.append(SolarEdgeRRCR(inverter, config_entry, coordinator))
             entities.append(
@@ -117,118 +126,6 @@ async def async_setup_entry(
                     SolarEdgeTemperatureMMPPT(mmppt_unit, config_entry, coordinator)
                 )
 
-    for meter in hub.meters:
-        entities.append(SolarEdgeDevice(meter, config_entry, coordinator))
-        entities.append(Version(meter, config_entry, coordinator))
-        entities.append(MeterEvents(meter, config_entry, coordinator))
-        entities.append(ACCurrentSensor(meter, config_entry, coordinator))
-        entities.append(ACCurrentSensor(meter, config_entry, coordinator, "A"))
-        entities.append(ACCurrentSensor(meter, config_entry, coordinator, "B"))
-        entities.append(ACCurrentSensor(meter, config_entry, coordinator, "C"))
-        entities.append(VoltageSensor(meter, config_entry, coordinator, "LN"))
-        entities.append(VoltageSensor(meter, config_entry, coordinator, "AN"))
-        entities.append(VoltageSensor(meter, config_entry, coordinator, "BN"))
-        entities.append(VoltageSensor(meter, config_entry, coordinator, "CN"))
-        entities.append(VoltageSensor(meter, config_entry, coordinator, "LL"))
-        entities.append(VoltageSensor(meter, config_entry, coordinator, "AB"))
-        entities.append(VoltageSensor(meter, config_entry, coordinator, "BC"))
-        entities.append(VoltageSensor(meter, config_entry, coordinator, "CA"))
-        entities.append(ACFrequency(meter, config_entry, coordinator))
-        entities.append(ACPower(meter, config_entry, coordinator))
-        entities.append(ACPower(meter, config_entry, coordinator, "A"))
-        entities.append(ACPower(meter, config_entry, coordinator, "B"))
-        entities.append(ACPower(meter, config_entry, coordinator, "C"))
-        entities.append(ACVoltAmp(meter, config_entry, coordinator))
-        entities.append(ACVoltAmp(meter, config_entry, coordinator, "A"))
-        entities.append(ACVoltAmp(meter, config_entry, coordinator, "B"))
-        entities.append(ACVoltAmp(meter, config_entry, coordinator, "C"))
-        entities.append(ACVoltAmpReactive(meter, config_entry, coordinator))
-        entities.append(ACVoltAmpReactive(meter, config_entry, coordinator, "A"))
-        entities.append(ACVoltAmpReactive(meter, config_entry, coordinator, "B"))
-        entities.append(ACVoltAmpReactive(meter, config_entry, coordinator, "C"))
-        entities.append(ACPowerFactor(meter, config_entry, coordinator))
-        entities.append(ACPowerFactor(meter, config_entry, coordinator, "A"))
-        entities.append(ACPowerFactor(meter, config_entry, coordinator, "B"))
-        entities.append(ACPowerFactor(meter, config_entry, coordinator, "C"))
-        entities.append(SolarEdgeACEnergy(meter, config_entry, coordinator, "Exported"))
-        entities.append(
-            SolarEdgeACEnergy(meter, config_entry, coordinator, "Exported_A")
-        )
-        entities.append(
-            SolarEdgeACEnergy(meter, config_entry, coordinator, "Exported_B")
-        )
-        entities.append(
-            SolarEdgeACEnergy(meter, config_entry, coordinator, "Exported_C")
-        )
-        entities.append(SolarEdgeACEnergy(meter, config_entry, coordinator, "Imported"))
-        entities.append(
-            SolarEdgeACEnergy(meter, config_entry, coordinator, "Imported_A")
-        )
-        entities.append(
-            SolarEdgeACEnergy(meter, config_entry, coordinator, "Imported_B")
-        )
-        entities.append(
-            SolarEdgeACEnergy(meter, config_entry, coordinator, "Imported_C")
-        )
-        entities.append(MeterVAhIE(meter, config_entry, coordinator, "Exported"))
-        entities.append(MeterVAhIE(meter, config_entry, coordinator, "Exported_A"))
-        entities.append(MeterVAhIE(meter, config_entry, coordinator, "Exported_B"))
-        entities.append(MeterVAhIE(meter, config_entry, coordinator, "Exported_C"))
-        entities.append(MeterVAhIE(meter, config_entry, coordinator, "Imported"))
-        entities.append(MeterVAhIE(meter, config_entry, coordinator, "Imported_A"))
-        entities.append(MeterVAhIE(meter, config_entry, coordinator, "Imported_B"))
-        entities.append(MeterVAhIE(meter, config_entry, coordinator, "Imported_C"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Import_Q1"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Import_Q1_A"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Import_Q1_B"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Import_Q1_C"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Import_Q2"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Import_Q2_A"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Import_Q2_B"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Import_Q2_C"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Export_Q3"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Export_Q3_A"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Export_Q3_B"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Export_Q3_C"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Export_Q4"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Export_Q4_A"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Export_Q4_B"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Export_Q4_C"))
-
-    for battery in hub.batteries:
-        entities.append(SolarEdgeDevice(battery, config_entry, coordinator))
-        entities.append(Version(battery, config_entry, coordinator))
-        entities.append(SolarEdgeBatteryAvgTemp(battery, config_entry, coordinator))
-        entities.append(SolarEdgeBatteryMaxTemp(battery, config_entry, coordinator))
-        entities.append(SolarEdgeBatteryVoltage(battery, config_entry, coordinator))
-        entities.append(SolarEdgeBatteryCurrent(battery, config_entry, coordinator))
-        entities.append(SolarEdgeBatteryPower(battery, config_entry, coordinator))
-        entities.append(
-            SolarEdgeBatteryEnergyExport(battery, config_entry, coordinator)
-        )
-        entities.append(
-            SolarEdgeBatteryEnergyImport(battery, config_entry, coordinator)
-        )
-        entities.append(SolarEdgeBatteryMaxEnergy(battery, config_entry, coordinator))
-        entities.append(
-            SolarEdgeBatteryMaxChargePower(battery, config_entry, coordinator)
-        )
-        entities.append(
-            SolarEdgeBatteryMaxDischargePower(battery, config_entry, coordinator)
-        )
-        entities.append(
-            SolarEdgeBatteryMaxChargePeakPower(battery, config_entry, coordinator)
-        )
-        entities.append(
-            SolarEdgeBatteryMaxDischargePeakPower(battery, config_entry, coordinator)
-        )
-        entities.append(
-            SolarEdgeBatteryAvailableEnergy(battery, config_entry, coordinator)
-        )
-        entities.append(SolarEdgeBatterySOH(battery, config_entry, coordinator))
-        entities.append(SolarEdgeBatterySOE(battery, config_entry, coordinator))
-        entities.append(SolarEdgeBatteryStatus(battery, config_entry, coordinator))
-
     if entities:
         async_add_entities(entities)
 
@@ -243,14 +140,11 @@ class SolarEdgeSensorBase(CoordinatorEntity, SensorEntity):
 
         self._platform = platform
         self._config_entry = config_entry
+        self._attr_device_info = platform.device_info
 
     def scale_factor(self, x: int, y: int):
         return x * (10**y)
 
-    @property
-    def device_info(self):
-        return self._platform.device_info
-
     @property
     def config_entry_id(self):
         return self._config_entry.entry_id
@@ -373,6 +267,17 @@ class ACCurrentSensor(SolarEdgeSensorBase):
 
         self._phase = phase
 
+        if self._phase is None:
+            self._model_key = "AC_Current"
+            self._attr_unique_id = f"{self._platform.uid_base}_ac_current"
+            self._attr_name = "AC Current"
+        else:
+            self._model_key = f"AC_Current_{self._phase.upper()}"
+            self._attr_unique_id = (
+                f"{self._platform.uid_base}_ac_current_{self._phase.lower()}"
+            )
+            self._attr_name = f"AC Current {self._phase.upper()}"
+
         if self._platform.decoded_model["C_SunSpec_DID"] in [101, 102, 103]:
             self.SUNSPEC_NOT_IMPL = SunSpecNotImpl.UINT16
         elif self._platform.decoded_model["C_SunSpec_DID"] in [201, 202, 203, 204]:
@@ -383,13 +288,6 @@ class ACCurrentSensor(SolarEdgeSensorBase):
                 f"{self._platform.decoded_model['C_SunSpec_DID']}"
             )
 
-    @property
-    def unique_id(self) -> str:
-        if self._phase is None:
-            return f"{self._platform.uid_base}_ac_current"
-        else:
-            return f"{self._platform.uid_base}_ac_current_{self._phase.lower()}"
-
     @property
     def entity_registry_enabled_default(self) -> bool:
         if self._phase is None:
@@ -409,32 +307,22 @@ class ACCurrentSensor(SolarEdgeSensorBase):
         else:
             return False
 
-    @property
-    def name(self) -> str:
-        if self._phase is None:
-            return "AC Current"
-        else:
-            return f"AC Current {self._phase.upper()}"
-
     @property
     def native_value(self):
-        if self._phase is None:
-            model_key = "AC_Current"
-        else:
-            model_key = f"AC_Current_{self._phase.upper()}"
+        decoded_model = self._platform.decoded_model
 
         try:
             if (
-                self._platform.decoded_model[model_key] == self.SUNSPEC_NOT_IMPL
-                or self._platform.decoded_model["AC_Current_SF"] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["AC_Current_SF"] not in SUNSPEC_SF_RANGE
+                decoded_model[self._model_key] == self.SUNSPEC_NOT_IMPL
+                or decoded_model["AC_Current_SF"] == SunSpecNotImpl.INT16
+                or decoded_model["AC_Current_SF"] not in SUNSPEC_SF_RANGE
             ):
                 return None
 
             else:
                 return self.scale_factor(
-                    self._platform.decoded_model[model_key],
-                    self._platform.decoded_model["AC_Current_SF"],
+                    decoded_model[self._model_key],
+                    decoded_model["AC_Current_SF"],
                 )
 
         except TypeError:
@@ -455,6 +343,17 @@ class VoltageSensor(SolarEdgeSensorBase):
 
         self._phase = phase
 
+        if self._phase is None:
+            self._model_key = "AC_Voltage"
+            self._attr_unique_id = f"{self._platform.uid_base}_ac_voltage"
+            self._attr_name = "AC Voltage"
+        else:
+            self._model_key = f"AC_Voltage_{self._phase.upper()}"
+            self._attr_unique_id = (
+                f"{self._platform.uid_base}_ac_voltage_{self._phase.lower()}"
+            )
+            self._attr_name = f"AC Voltage {self._phase.upper()}"
+
         if self._platform.decoded_model["C_SunSpec_DID"] in [101, 102, 103]:
             self.SUNSPEC_NOT_IMPL = SunSpecNotImpl.UINT16
         elif self._platform.decoded_model["C_SunSpec_DID"] in [201, 202, 203, 204]:
@@ -465,13 +364,6 @@ class VoltageSensor(SolarEdgeSensorBase):
                 f"{self._platform.decoded_model['C_SunSpec_DID']}"
             )
 
-    @property
-    def unique_id(self) -> str:
-        if self._phase is None:
-            return f"{self._platform.uid_base}_ac_voltage"
-        else:
-            return f"{self._platform.uid_base}_ac_voltage_{self._phase.lower()}"
-
     @property
     def entity_registry_enabled_default(self) -> bool:
         if self._phase is None:
@@ -496,32 +388,22 @@ class VoltageSensor(SolarEdgeSensorBase):
         else:
             return False
 
-    @property
-    def name(self) -> str:
-        if self._phase is None:
-            return "AC Voltage"
-        else:
-            return f"AC Voltage {self._phase.upper()}"
-
     @property
     def native_value(self):
-        if self._phase is None:
-            model_key = "AC_Voltage"
-        else:
-            model_key = f"AC_Voltage_{self._phase.upper()}"
+        decoded_model = self._platform.decoded_model
 
         try:
             if (
-                self._platform.decoded_model[model_key] == self.SUNSPEC_NOT_IMPL
-                or self._platform.decoded_model["AC_Voltage_SF"] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["AC_Voltage_SF"] not in SUNSPEC_SF_RANGE
+                decoded_model[self._model_key] == self.SUNSPEC_NOT_IMPL
+                or decoded_model["AC_Voltage_SF"] == SunSpecNotImpl.INT16
+                or decoded_model["AC_Voltage_SF"] not in SUNSPEC_SF_RANGE
             ):
                 return None
 
             else:
                 return self.scale_factor(
-                    self._platform.decoded_model[model_key],
-                    self._platform.decoded_model["AC_Voltage_SF"],
+                    decoded_model[self._model_key],
+                    decoded_model["AC_Voltage_SF"],
                 )
 
         except TypeError:
@@ -543,12 +425,16 @@ class ACPower(SolarEdgeSensorBase):
 
         self._phase = phase
 
-    @property
-    def unique_id(self) -> str:
         if self._phase is None:
-            return f"{self._platform.uid_base}_ac_power"
+            self._model_key = "AC_Power"
+            self._attr_unique_id = f"{self._platform.uid_base}_ac_power"
+            self._attr_name = "AC Power"
         else:
-            return f"{self._platform.uid_base}_ac_power_{self._phase.lower()}"
+            self._model_key = f"AC_Power_{self._phase.upper()}"
+            self._attr_unique_id = (
+                f"{self._platform.uid_base}_ac_power_{self._phase.lower()}"
+            )
+            self._attr_name = f"AC Power {self._phase.upper()}"
 
     @property
     def entity_registry_enabled_default(self) -> bool:
@@ -568,31 +454,21 @@ class ACPower(SolarEdgeSensorBase):
         else:
             return False
 
-    @property
-    def name(self) -> str:
-        if self._phase is None:
-            return "AC Power"
-        else:
-            return f"AC Power {self._phase.upper()}"
-
     @property
     def native_value(self):
-        if self._phase is None:
-            model_key = "AC_Power"
-        else:
-            model_key = f"AC_Power_{self._phase.upper()}"
+        decoded_model = self._platform.decoded_model
 
         try:
             if (
-                self._platform.decoded_model[model_key] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["AC_Power_SF"] == SunSpecNotImpl.INT16
+                decoded_model[self._model_key] == SunSpecNotImpl.INT16
+                or decoded_model["AC_Power_SF"] == SunSpecNotImpl.INT16
             ):
                 return None
 
             else:
                 return self.scale_factor(
-                    self._platform.decoded_model[model_key],
-                    self._platform.decoded_model["AC_Power_SF"],
+                    decoded_model[self._model_key],
+                    decoded_model["AC_Power_SF"],
                 )
 
         except TypeError:
@@ -652,19 +528,16 @@ class ACVoltAmp(SolarEdgeSensorBase):
 
         self._phase = phase
 
-    @property
-    def unique_id(self) -> str:
-        if self._phase is None:
-            return f"{self._platform.uid_base}_ac_va"
-        else:
-            return f"{self._platform.uid_base}_ac_va_{self._phase.lower()}"
-
-    @property
-    def name(self) -> str:
         if self._phase is None:
-            return "AC Apparent Power"
+            self._model_key = "AC_VA"
+            self._attr_unique_id = f"{self._platform.uid_base}_ac_va"
+            self._attr_name = "AC Apparent Power"
         else:
-            return f"AC Apparent Power {self._phase.upper()}"
+            self._model_key = f"AC_VA_{self._phase.upper()}"
+            self._attr_unique_id = (
+                f"{self._platform.uid_base}_ac_va_{self._phase.lower()}"
+            )
+            self._attr_name = f"AC Apparent Power {self._phase.upper()}"
 
     @property
     def entity_registry_enabled_default(self) -> bool:
@@ -672,23 +545,20 @@ class ACVoltAmp(SolarEdgeSensorBase):
 
     @property
     def native_value(self):
-        if self._phase is None:
-            model_key = "AC_VA"
-        else:
-            model_key = f"AC_VA_{self._phase.upper()}"
+        decoded_model = self._platform.decoded_model
 
         try:
             if (
-                self._platform.decoded_model[model_key] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["AC_VA_SF"] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["AC_VA_SF"] not in SUNSPEC_SF_RANGE
+                decoded_model[self._model_key] == SunSpecNotImpl.INT16
+                or decoded_model["AC_VA_SF"] == SunSpecNotImpl.INT16
+                or decoded_model["AC_VA_SF"] not in SUNSPEC_SF_RANGE
             ):
                 return None
 
             else:
                 return self.scale_factor(
-                    self._platform.decoded_model[model_key],
-                    self._platform.decoded_model["AC_VA_SF"],
+                    decoded_model[self._model_key],
+                    decoded_model["AC_VA_SF"],
                 )
 
         except TypeError:
@@ -709,19 +579,16 @@ class ACVoltAmpReactive(SolarEdgeSensorBase):
         """Initialize the sensor."""
         self._phase = phase
 
-    @property
-    def unique_id(self) -> str:
-        if self._phase is None:
-            return f"{self._platform.uid_base}_ac_var"
-        else:
-            return f"{self._platform.uid_base}_ac_var_{self._phase.lower()}"
-
-    @property
-    def name(self) -> str:
         if self._phase is None:
-            return "AC Reactive Power"
+            self._model_key = "AC_var"
+            self._attr_unique_id = f"{self._platform.uid_base}_ac_var"
+            self._attr_name = "AC Reactive Power"
         else:
-            return f"AC Reactive Power {self._phase.upper()}"
+            self._model_key = f"AC_var_{self._phase.upper()}"
+            self._attr_unique_id = (
+                f"{self._platform.uid_base}_ac_var_{self._phase.lower()}"
+            )
+            self._attr_name = f"AC Reactive Power {self._phase.upper()}"
 
     @property
     def entity_registry_enabled_default(self) -> bool:
@@ -729,23 +596,20 @@ class ACVoltAmpReactive(SolarEdgeSensorBase):
 
     @property
     def native_value(self):
-        if self._phase is None:
-            model_key = "AC_var"
-        else:
-            model_key = f"AC_var_{self._phase.upper()}"
+        decoded_model = self._platform.decoded_model
 
         try:
             if (
-                self._platform.decoded_model[model_key] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["AC_var_SF"] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["AC_var_SF"] not in SUNSPEC_SF_RANGE
+                decoded_model[self._model_key] == SunSpecNotImpl.INT16
+                or decoded_model["AC_var_SF"] == SunSpecNotImpl.INT16
+                or decoded_model["AC_var_SF"] not in SUNSPEC_SF_RANGE
             ):
                 return None
 
             else:
                 return self.scale_factor(
-                    self._platform.decoded_model[model_key],
-                    self._platform.decoded_model["AC_var_SF"],
+                    decoded_model[self._model_key],
+                    decoded_model["AC_var_SF"],
                 )
 
         except TypeError:
@@ -766,19 +630,16 @@ class ACPowerFactor(SolarEdgeSensorBase):
 
         self._phase = phase
 
-    @property
-    def unique_id(self) -> str:
         if self._phase is None:
-            return f"{self._platform.uid_base}_ac_pf"
+            self._model_key = "AC_PF"
+            self._attr_unique_id = f"{self._platform.uid_base}_ac_pf"
+            self._attr_name = "AC Power Factor"
         else:
-            return f"{self._platform.uid_base}_ac_pf_{self._phase.lower()}"
-
-    @property
-    def name(self) -> str:
-        if self._phase is None:
-            return "AC Power Factor"
-        else:
-            return f"AC Power Factor {self._phase.upper()}"
+            self._model_key = f"AC_PF_{self._phase.upper()}"
+            self._attr_unique_id = (
+                f"{self._platform.uid_base}_ac_pf_{self._phase.lower()}"
+            )
+            self._attr_name = f"AC Power Factor {self._phase.upper()}"
 
     @property
     def entity_registry_enabled_default(self) -> bool:
@@ -786,23 +647,20 @@ class ACPowerFactor(SolarEdgeSensorBase):
 
     @property
     def native_value(self):
-        if self._phase is None:
-            model_key = "AC_PF"
-        else:
-            model_key = f"AC_PF_{self._phase.upper()}"
+        decoded_model = self._platform.decoded_model
 
         try:
             if (
-                self._platform.decoded_model[model_key] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["AC_PF_SF"] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["AC_PF_SF"] not in SUNSPEC_SF_RANGE
+                decoded_model[self._model_key] == SunSpecNotImpl.INT16
+                or decoded_model["AC_PF_SF"] == SunSpecNotImpl.INT16
+                or decoded_model["AC_PF_SF"] not in SUNSPEC_SF_RANGE
             ):
                 return None
 
             else:
                 return self.scale_factor(
-                    self._platform.decoded_model[model_key],
-                    self._platform.decoded_model["AC_PF_SF"],
+                    decoded_model[self._model_key],
+                    decoded_model["AC_PF_SF"],
                 )
 
         except TypeError:
@@ -830,34 +688,20 @@ class SolarEdgeACEnergy(SolarEdgeSensorBase):
         self._value = None
         self._log_once = False
 
-        if self._phase is None:
-            self._model_key = "AC_Energy_WH"
-        else:
-            self._model_key = f"AC_Energy_WH_{self._phase}"
-
-    @property
-    def icon(self) -> str:
-        if self._phase is None:
-            return None
-
-        elif re.match("import", self._phase.lower()):
-            return "mdi:transmission-tower-export"
-
-        elif re.match("export", self._phase.lower()):
-            return "mdi:transmission-tower-import"
-
-        else:
-            return None
-
-    @property
-    def unique_id(self) -> str:
         # older versions of the integration converted to kWh internally
         # before home assistant had UI configurable units and precision
         # changing the unique_id now would cause new entities to be created
         if self._phase is None:
-            return f"{self._platform.uid_base}_ac_energy_kwh"
+            self._model_key = "AC_Energy_WH"
+            self._attr_unique_id = f"{self._platform.uid_base}_ac_energy_kwh"
+            self._attr_name = "AC Energy"
         else:
-            return f"{self._platform.uid_base}_{self._phase.lower()}_kwh"
+            self._model_key = f"AC_Energy_WH_{self._phase}"
+            self._attr_unique_id = (
+                f"{self._platform.uid_base}_{self._phase.lower()}_kwh"
+            )
+            self._attr_name = f"AC Energy {self._phase.replace('_', ' ')}"
+            self._attr_icon = ENERGY_DIRECTION_ICONS.get(self._phase[:6].lower())
 
     @property
     def entity_registry_enabled_default(self) -> bool:
@@ -882,13 +726,6 @@ class SolarEdgeACEnergy(SolarEdgeSensorBase):
 
         return False
 
-    @property
-    def name(self) -> str:
-        if self._phase is None:
-            return "AC Energy"
-        else:
-            return f"AC Energy {re.sub('_', ' ', self._phase)}"
-
     @property
     def available(self) -> bool:
         try:
@@ -1543,21 +1380,10 @@ class MeterEvents(SolarEdgeSensorBase):
     @property
     def extra_state_attributes(self):
         attrs = {}
-        m_events_active = []
-
-        if int(str(self._platform.decoded_model["M_Events"])) == 0x0:
-            attrs["events"] = str(m_events_active)
-        else:
-            for i in range(2, 31):
-                try:
-                    if int(str(self._platform.decoded_model["M_Events"])) & (1 << i):
-                        m_events_active.append(METER_EVENTS[i])
-
-                except KeyError:
-                    pass
+        m_events = int(self._platform.decoded_model["M_Events"])
 
-        attrs["bits"] = f"{int(self._platform.decoded_model['M_Events']):032b}"
-        attrs["events"] = str(m_events_active)
+        attrs["bits"] = f"{m_events:032b}"
+        attrs["events"] = decode_meter_events(m_events)
 
         return attrs
 
@@ -1591,22 +1417,10 @@ class SolarEdgeMMPPTEvents(SolarEdgeSensorBase):
     @property
     def extra_state_attributes(self) -> str:
         attrs = {}
-        mmppt_events_active = []
+        mmppt_events = int(self._platform.decoded_model["mmppt_Events"])
 
-        if int(str(self._platform.decoded_model["mmppt_Events"])) == 0x0:
-            attrs["events"] = str(mmppt_events_active)
-        else:
-            for i in range(0, 31):
-                try:
-                    if int(str(self._platform.decoded_model["mmppt_Events"])) & (
-                        1 << i
-                    ):
-                        mmppt_events_active.append(MMPPT_EVENTS[i])
-                except KeyError:
-                    pass
-
-        attrs["events"] = str(mmppt_events_active)
-        attrs["bits"] = f"{int(self._platform.decoded_model['mmppt_Events']):032b}"
+        attrs["events"] = decode_mmppt_events(mmppt_events)
+        attrs["bits"] = f"{mmppt_events:032b}"
 
         return attrs
 
@@ -1619,61 +1433,38 @@ class MeterVAhIE(SolarEdgeSensorBase):
     def __init__(self, platform, config_entry, coordinator, phase: str = None):
         super().__init__(platform, config_entry, coordinator)
 
+        if phase is None:
+            raise ValueError("MeterVAhIE requires a phase")
+
         self._phase = phase
         self.last = None
 
-    @property
-    def icon(self) -> str:
-        if self._phase is None:
-            return None
-
-        elif re.match("import", self._phase.lower()):
-            return "mdi:transmission-tower-export"
-
-        elif re.match("export", self._phase.lower()):
-            return "mdi:transmission-tower-import"
-
-        else:
-            return None
-
-    @property
-    def unique_id(self) -> str:
-        if self._phase is None:
-            raise NotImplementedError
-        else:
-            return f"{self._platform.uid_base}_" f"{self._phase.lower()}_vah"
+        self._model_key = f"M_VAh_{self._phase}"
+        self._attr_unique_id = f"{self._platform.uid_base}_{self._phase.lower()}_vah"
+        self._attr_name = f"Apparent Energy {self._phase.replace('_', ' ')}"
+        self._attr_icon = ENERGY_DIRECTION_ICONS.get(self._phase[:6].lower())
 
     @property
     def entity_registry_enabled_default(self) -> bool:
         return False
 
-    @property
-    def name(self) -> str:
-        if self._phase is None:
-            raise NotImplementedError
-        else:
-            return f"Apparent Energy {re.sub('_', ' ', self._phase)}"
-
     @property
     def native_value(self):
-        if self._phase is None:
-            raise NotImplementedError
-        else:
-            model_key = f"M_VAh_{self._phase}"
+        decoded_model = self._platform.decoded_model
 
         try:
             if (
-                self._platform.decoded_model[model_key] == SunSpecAccum.NA32
-                or self._platform.decoded_model[model_key] > SunSpecAccum.LIMIT32
-                or self._platform.decoded_model["M_VAh_SF"] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["M_VAh_SF"] not in SUNSPEC_SF_RANGE
+                decoded_model[self._model_key] == SunSpecAccum.NA32
+                or decoded_model[self._model_key] > SunSpecAccum.LIMIT32
+                or decoded_model["M_VAh_SF"] == SunSpecNotImpl.INT16
+                or decoded_model["M_VAh_SF"] not in SUNSPEC_SF_RANGE
             ):
                 return None
 
             else:
                 value = self.scale_factor(
-                    self._platform.decoded_model[model_key],
-                    self._platform.decoded_model["M_VAh_SF"],
+                    decoded_model[self._model_key],
+                    decoded_model["M_VAh_SF"],
                 )
 
                 try:
@@ -1697,61 +1488,38 @@ class MetervarhIE(SolarEdgeSensorBase):
     def __init__(self, platform, config_entry, coordinator, phase: str = None):
         super().__init__(platform, config_entry, coordinator)
 
+        if phase is None:
+            raise ValueError("MetervarhIE requires a phase")
+
         self._phase = phase
         self.last = None
 
-    @property
-    def icon(self) -> str:
-        if self._phase is None:
-            return None
-
-        elif re.match("import", self._phase.lower()):
-            return "mdi:transmission-tower-export"
-
-        elif re.match("export", self._phase.lower()):
-            return "mdi:transmission-tower-import"
-
-        else:
-            return None
-
-    @property
-    def unique_id(self) -> str:
-        if self._phase is None:
-            raise NotImplementedError
-        else:
-            return f"{self._platform.uid_base}_{self._phase.lower()}_varh"
+        self._model_key = f"M_varh_{self._phase}"
+        self._attr_unique_id = f"{self._platform.uid_base}_{self._phase.lower()}_varh"
+        self._attr_name = f"Reactive Energy {self._phase.replace('_', ' ')}"
+        self._attr_icon = ENERGY_DIRECTION_ICONS.get(self._phase[:6].lower())
 
     @property
     def entity_registry_enabled_default(self) -> bool:
         return False
 
-    @property
-    def name(self) -> str:
-        if self._phase is None:
-            raise NotImplementedError
-        else:
-            return f"Reactive Energy {re.sub('_', ' ', self._phase)}"
-
     @property
     def native_value(self):
-        if self._phase is None:
-            raise NotImplementedError
-        else:
-            model_key = f"M_varh_{self._phase}"
+        decoded_model = self._platform.decoded_model
 
         try:
             if (
-                self._platform.decoded_model[model_key] == SunSpecAccum.NA32
-                or self._platform.decoded_model[model_key] > SunSpecAccum.LIMIT32
-                or self._platform.decoded_model["M_varh_SF"] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["M_varh_SF"] not in SUNSPEC_SF_RANGE
+                decoded_model[self._model_key] == SunSpecAccum.NA32
+                or decoded_model[self._model_key] > SunSpecAccum.LIMIT32
+                or decoded_model["M_varh_SF"] == SunSpecNotImpl.INT16
+                or decoded_model["M_varh_SF"] not in SUNSPEC_SF_RANGE
             ):
                 return None
 
             else:
                 value = self.scale_factor(
-                    self._platform.decoded_model[model_key],
-                    self._platform.decoded_model["M_varh_SF"],
+                    decoded_model[self._model_key],
+                    decoded_model["M_varh_SF"],
                 )
 
                 try:
@@ -2398,3 +2166,67 @@ class SolarEdgeDefaultControlSettings(SolarEdgeSensorBase):
             attrs["status"] = "ERROR"
 
         return attrs
+
+
+# Sensors created for every device of a type: (sensor class, *extra args).
+INVERTER_SENSORS = (
+    (SolarEdgeDevice,),
+    (Version,),
+    (SolarEdgeInverterStatus,),
+    (StatusVendor,),
+    *((ACCurrentSensor, phase) for phase in PHASES),
+    *((VoltageSensor, phase) for phase in ("AB", "BC", "CA", "AN", "BN", "CN")),
+    (ACPower,),
+    (ACFrequency,),
+    (ACVoltAmp,),
+    (ACVoltAmpReactive,),
+    (ACPowerFactor,),
+    (SolarEdgeACEnergy,),
+    (DCCurrent,),
+    (DCVoltage,),
+    (DCPower,),
+    (HeatSinkTemperature,),
+)
+
+METER_SENSORS = (
+    (SolarEdgeDevice,),
+    (Version,),
+    (MeterEvents,),
+    (ACFrequency,),
+    *(
+        (sensor_class, phase)
+        for sensor_class, phases in (
+            (ACCurrentSensor, PHASES),
+            (VoltageSensor, METER_VOLTAGE_PHASES),
+            (ACPower, PHASES),
+            (ACVoltAmp, PHASES),
+            (ACVoltAmpReactive, PHASES),
+            (ACPowerFactor, PHASES),
+            (SolarEdgeACEnergy, METER_ENERGY_PHASES),
+            (MeterVAhIE, METER_ENERGY_PHASES),
+            (MetervarhIE, METER_VARH_PHASES),
+        )
+        for phase in phases
+    ),
+)
+
+BATTERY_SENSORS = (
+    (SolarEdgeDevice,),
+    (Version,),
+    (SolarEdgeBatteryAvgTemp,),
+    (SolarEdgeBatteryMaxTemp,),
+    (SolarEdgeBatteryVoltage,),
+    (SolarEdgeBatteryCurrent,),
+    (SolarEdgeBatteryPower,),
+    (SolarEdgeBatteryEnergyExport,),
+    (SolarEdgeBatteryEnergyImport,),
+    (SolarEdgeBatteryMaxEnergy,),
+    (SolarEdgeBatteryMaxChargePower,),
+    (SolarEdgeBatteryMaxDischargePower,),
+    (SolarEdgeBatteryMaxChargePeakPower,),
+    (SolarEdgeBatteryMaxDischargePeakPower,),
+    (SolarEdgeBatteryAvailableEnergy,),
+    (SolarEdgeBatterySOH,),
+    (SolarEdgeBatterySOE,),
+    (SolarEdgeBatteryStatus,),
+)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Final
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
@@ -16,7 +16,7 @@ from pymodbus.payload import BinaryPayloadBuilder
 
 from .const import DOMAIN, SunSpecNotImpl
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER: Final = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
@@ -24,8 +24,9 @@ async def async_setup_entry(
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    hub = hass.data[DOMAIN][config_entry.entry_id]["hub"]
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    runtime_data = hass.data[DOMAIN][config_entry.entry_id]
+    hub = runtime_data.hub
+    coordinator = runtime_data.coordinator
 
     entities = []
 
@@ -56,10 +57,8 @@ class SolarEdgeSwitchBase(CoordinatorEntity, SwitchEntity):
         """Initialize the sensor."""
         self._platform = platform
         self._config_entry = config_entry
-
-    @property
-    def device_info(self):
-        return self._platform.device_info
+        self._attr_device_info = platform.device_info
+        self._attr_unique_id = f"{platform.uid_base}{self._unique_id_suffix}"
 
     @property
     def config_entry_id(self):
@@ -82,6 +81,8 @@ class SolarEdgeExternalProduction(SolarEdgeSwitchBase):
     """External Production switch. Indicates a non-SolarEdge power sorce in system."""
 
     entity_category = EntityCategory.CONFIG
+    _attr_name = "External Production"
+    _unique_id_suffix = "_external_production"
 
     @property
     def available(self) -> bool:
@@ -94,14 +95,6 @@ class SolarEdgeExternalProduction(SolarEdgeSwitchBase):
         except KeyError:
             return False
 
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_external_production"
-
-    @property
-    def name(self) -> str:
-        return "External Production"
-
     @property
     def entity_registry_enabled_default(self) -> bool:
         return False
@@ -133,6 +126,8 @@ class SolarEdgeNegativeSiteLimit(SolarEdgeSwitchBase):
     """Negative Site Limit switch. Sets minimum import power when enabled."""
 
     entity_category = EntityCategory.CONFIG
+    _attr_name = "Negative Site Limit"
+    _unique_id_suffix = "_negative_site_limit"
 
     @property
     def available(self) -> bool:
@@ -145,14 +140,6 @@ class SolarEdgeNegativeSiteLimit(SolarEdgeSwitchBase):
         except KeyError:
             return False
 
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_negative_site_limit"
-
-    @property
-    def name(self) -> str:
-        return "Negative Site Limit"
-
     @property
     def is_on(self) -> bool:
         return (int(self._platform.decoded_model["E_Lim_Ctl_Mode"]) >> 11) & 1
@@ -180,23 +167,17 @@ class SolarEdgeGridControl(SolarEdgeSwitchBase):
     """Grid Control boolean switch. This is "AdvancedPwrControlEn" in specs."""
 
     entity_category = EntityCategory.CONFIG
+    _attr_name = "Advanced Power Control"
+    _unique_id_suffix = "_adv_pwr_ctrl"
 
     @property
     def available(self) -> bool:
         return (
             super().available
             and self._platform.advanced_power_control
-            and "AdvPwrCtrlEn" in self._platform.decoded_model.keys()
+            and "AdvPwrCtrlEn" in self._platform.decoded_model
         )
 
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_adv_pwr_ctrl"
-
-    @property
-    def name(self) -> str:
-        return "Advanced Power Control"
-
     @property
     def is_on(self) -> bool:
         return self._platform.decoded_model["AdvPwrCtrlEn"] == 0x1